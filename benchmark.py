@@ -0,0 +1,197 @@
+"""
+Benchmark the GRM solver over a grid of players number x pure strategies number.
+
+    python benchmark.py run --output baseline.json
+    python benchmark.py run --players 2 3 4 --strategies 2 3 --engine joint --output new.json
+    python benchmark.py run --dtype float32 --output float32.json
+    python benchmark.py compare baseline.json new.json
+
+For every game of the grid, a random game is built by `player_assign_random_payoff`
+and the following are measured:
+    load_seconds: time of assigning the random payoffs
+    iterations_per_second: throughput of `Game.run`
+    vertex_dist_seconds: time of one `compute_joint_dist_on_vertex` call
+    peak_memory_bytes: peak memory traced while loading and running
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import grm
+
+# metrics where bigger is worse, and those where bigger is better
+COST_METRICS = ("load_seconds", "vertex_dist_seconds", "peak_memory_bytes")
+THROUGHPUT_METRICS = ("iterations_per_second",)
+
+
+def build_game(players_num, pures_num, dtype):
+    game = grm.Game(dtype, reporter=None, seed=0)
+    for _ in range(players_num):
+        game.player_join(grm.Player(pures_num))
+    game.player_init_mixed_strategies()
+    return game
+
+
+def bench_game(players_num, pures_num, iterations, engine, dtype, repeats):
+    game = build_game(players_num, pures_num, dtype)
+    time_start = time.perf_counter()
+    game.player_assign_random_payoff()
+    load_seconds = time.perf_counter() - time_start
+
+    time_start = time.perf_counter()
+    game.run(iterations=iterations, engine=engine, record="off")
+    run_seconds = time.perf_counter() - time_start
+
+    time_start = time.perf_counter()
+    for _ in range(repeats):
+        game.compute_joint_dist_on_vertex(0, 0)
+    vertex_dist_seconds = (time.perf_counter() - time_start) / repeats
+
+    # tracing slows everything down, so the memory is measured on a run of its own
+    tracemalloc.start()
+    game = build_game(players_num, pures_num, dtype)
+    game.player_assign_random_payoff()
+    game.run(iterations=min(iterations, 10), engine=engine, record="off")
+    peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "players": players_num,
+        "strategies": pures_num,
+        "cells": pures_num**players_num,
+        "engine": engine,
+        "dtype": dtype,
+        "iterations": iterations,
+        "load_seconds": load_seconds,
+        "iterations_per_second": iterations / run_seconds,
+        "vertex_dist_seconds": vertex_dist_seconds,
+        "peak_memory_bytes": peak_memory_bytes,
+    }
+
+
+def run(args):
+    results = []
+    for players_num in args.players:
+        for pures_num in args.strategies:
+            if pures_num**players_num > args.max_cells:
+                continue
+            result = bench_game(
+                players_num,
+                pures_num,
+                args.iterations,
+                args.engine,
+                args.dtype,
+                args.repeats,
+            )
+            results.append(result)
+            print(
+                "players %(players)s, strategies %(strategies)s: "
+                "%(iterations_per_second).1f iterations/s" % result,
+                file=sys.stderr,
+            )
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+def compare(args):
+    """flag the metrics of the new results worse than the old ones by more than threshold"""
+    with open(args.old) as f:
+        old_l = json.load(f)["results"]
+    with open(args.new) as f:
+        new_l = json.load(f)["results"]
+
+    # games are matched by size only, so that engines and dtypes can be compared too
+    def key(r):
+        return r["players"], r["strategies"]
+
+    old_d = {key(r): r for r in old_l}
+    regressions = 0
+    for new in new_l:
+        old = old_d.get(key(new))
+        if old is None:
+            continue
+        for metric in COST_METRICS + THROUGHPUT_METRICS:
+            if not old[metric] or not new[metric]:
+                continue
+            ratio = new[metric] / old[metric]
+            if metric in THROUGHPUT_METRICS:
+                ratio = 1 / ratio
+            flag = ""
+            if ratio > 1 + args.threshold:
+                flag = "REGRESSION"
+                regressions += 1
+            elif ratio < 1 / (1 + args.threshold):
+                flag = "improvement"
+            print(
+                "players %s, strategies %s: %s %.4g (%s %s) -> %.4g (%s %s) %s"
+                % (
+                    new["players"],
+                    new["strategies"],
+                    metric,
+                    old[metric],
+                    old["engine"],
+                    old.get("dtype", "float64"),
+                    new[metric],
+                    new["engine"],
+                    new.get("dtype", "float64"),
+                    flag,
+                )
+            )
+    print("%s regressions" % regressions)
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark the GRM solver")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark grid")
+    run_parser.add_argument("--players", type=int, nargs="+", default=range(2, 8))
+    run_parser.add_argument("--strategies", type=int, nargs="+", default=range(2, 10))
+    run_parser.add_argument(
+        "--max-cells",
+        type=int,
+        default=10**5,
+        help="skip the games whose product space is bigger than this",
+    )
+    run_parser.add_argument("--iterations", type=int, default=100)
+    run_parser.add_argument("--engine", default="tensor")
+    run_parser.add_argument(
+        "--dtype", default="float64", choices=("float64", "float32"), help="payoff storage"
+    )
+    run_parser.add_argument(
+        "--repeats", type=int, default=20, help="calls to time the vertex distribution"
+    )
+    run_parser.add_argument("--output", help="JSON file, stdout by default")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change to flag"
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
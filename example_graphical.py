@@ -0,0 +1,20 @@
+import grm
+
+game = grm.Game()
+
+# thirty palyers sitting in a ring, each uses three pure strategies
+players_num = 30
+for _ in range(players_num):
+    game.player_join(grm.Player(3))
+
+game.player_init_mixed_strategies()
+
+# set the payoff: each player's payoff depends only on itself and its two neighbours
+neighbourhoods = [
+    ((i - 1) % players_num + 1, i + 1, (i + 1) % players_num + 1)
+    for i in range(players_num)
+]
+game.player_assign_random_payoff(neighbourhoods)
+
+# run the iterations to approximate Nash equilibrium
+game.run(iterations=10**4, record="off")
@@ -0,0 +1,13 @@
+import grm
+
+# twenty palyers, each uses the same three pure strategies,
+# and their payoffs depend only on how many others use each pure strategy
+game = grm.SymmetricGame(20, 3)
+
+game.init_mixed_strategy()
+
+# set the payoff
+game.assign_random_payoff()
+
+# run the iterations to approximate a symmetric Nash equilibrium
+game.run(iterations=10**4)
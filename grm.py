@@ -2,135 +2,1323 @@
 The implementation is based on the method proposed by https://doi.org/10.1063/5.0012735
 """
 import numpy as np
+import os
+import json
+import hashlib
+import cProfile
+import pstats
+import tracemalloc
+import math
+import re
+import shutil
 import sys
-import random
+import time
 import itertools
+import zipfile
+from fractions import Fraction
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+
+class GRMError(Exception):
+    """the base of all the errors raised by grm"""
+
+
+class GameError(GRMError, ValueError):
+    """the game is defined wrong: players, payoffs, combinations of pure strategies"""
+
+
+class StrategyError(GRMError, ValueError):
+    """the given mixed strategies do not fit the players"""
+
+
+class ParameterError(GRMError, ValueError):
+    """an unknown option, e.g. engine, order, solver or recording policy"""
+
+
+class UnsupportedError(GRMError):
+    """the operation is not available for this game"""
+
+
+class NotSolvedError(GRMError):
+    """the operation needs a solved game"""
+
+
+class Result(object):
+    """
+    the approximate NE found by a run:
+        equilibrium: the mixed strategies of all players
+        payoffs: the expected payoffs of all players on it, in the original payoffs
+        deviations: the regret vectors of all players on it, in the regularized payoffs
+        deviation_sums, deviation_overall: their sums per player and overall
+        iterations_used, stop_reason: see `Game.iterate`
+        surviving_strategies: the pure strategies (starting from 0) left by
+            the elimination of strictly dominated strategies, if any
+        cached: whether it was found in an `EquilibriumCache`
+        equilibria: all the NEs found by `Game.solve_exact`, one `Result` each,
+            the first of which the result is about, or None for an approximation
+    """
+
+    def __init__(
+        self,
+        equilibrium,
+        payoffs,
+        deviations,
+        iterations_used=None,
+        stop_reason=None,
+        surviving_strategies=None,
+        cached=False,
+        equilibria=None,
+    ):
+        self.equilibrium = equilibrium
+        self.payoffs = payoffs
+        self.deviations = deviations
+        self.deviation_sums = [float(r.sum()) for r in deviations]
+        self.deviation_overall = float(np.sum(self.deviation_sums))
+        self.iterations_used = iterations_used
+        self.stop_reason = stop_reason
+        self.surviving_strategies = surviving_strategies
+        self.cached = cached
+        self.equilibria = equilibria
+
+    def as_dict(self):
+        """the result in plain lists and numbers, e.g. for JSON"""
+        d = {
+            "equilibrium": [np.asarray(x).tolist() for x in self.equilibrium],
+            "payoffs": [float(p) for p in self.payoffs],
+            "deviations": [np.asarray(r).tolist() for r in self.deviations],
+            "deviation_overall": self.deviation_overall,
+            "iterations_used": self.iterations_used,
+            "stop_reason": self.stop_reason,
+            "cached": self.cached,
+        }
+        if self.equilibria is not None:
+            d["equilibria"] = [ne.as_dict() for ne in self.equilibria]
+        if self.surviving_strategies is not None:
+            d["surviving_strategies"] = [
+                np.asarray(s).tolist() for s in self.surviving_strategies
+            ]
+        return d
+
+    def __repr__(self):
+        return "Result(deviation_overall=%s, stop_reason=%s, iterations_used=%s)" % (
+            round(self.deviation_overall, 4),
+            self.stop_reason,
+            self.iterations_used,
+        )
+
+
+class Certificate(object):
+    """
+    the verification of strategy profiles by `Game.verify`, on the original payoffs,
+    for one profile or every profile of a batch:
+        epsilon: the most any player can gain by deviating, i.e. the largest gap
+            plus the error bound, so that the profile is certainly an epsilon-NE
+        gaps: the best-response gap of every player, its best payoff minus its payoff
+        payoffs: the expected payoff of every player
+        best_responses: a best pure strategy of every player (starting from 0)
+        error_bound: the bound on the rounding errors of the payoffs stored
+            and of the contraction, taken into epsilon
+    epsilon is a float for one profile, or a (K,) array for K profiles,
+    and the others are (players,) or (K, players) arrays
+    """
+
+    def __init__(self, epsilon, gaps, payoffs, best_responses, error_bound):
+        self.epsilon = epsilon
+        self.gaps = gaps
+        self.payoffs = payoffs
+        self.best_responses = best_responses
+        self.error_bound = error_bound
+
+    def certifies(self, epsilon):
+        """whether the profile is an `epsilon`-NE for sure, per profile of a batch"""
+        return self.epsilon <= epsilon
+
+    def __repr__(self):
+        return "Certificate(epsilon=%s)" % np.round(self.epsilon, 6)
+
+
+class Reporter(object):
+    """
+    where a game reports to as it goes, silent by itself.
+    pass a subclass to `Game` for output, like `ConsoleReporter`
+    """
+
+    def message(self, text):
+        pass
+
+    def header(self, title):
+        pass
+
+    def initial_strategies(self, mixed_strategy_l):
+        pass
+
+    def eliminated(self, surviving_l, pure_strategies_num_l):
+        pass
+
+    def equilibrium(self, result):
+        pass
+
+    def stopped(self, result):
+        pass
+
+    def batch_deviation(self, regret_sum_overall):
+        pass
+
+    def catalogue(self, catalogue):
+        pass
+
+    def symmetric_equilibrium(self, players_num, result):
+        pass
+
+
+class ConsoleReporter(Reporter):
+    """print everything on the console, which is what a game does by default"""
+
+    def message(self, text):
+        print(text)
+
+    def header(self, title):
+        print("=========== %s ============" % title)
+
+    def initial_strategies(self, mixed_strategy_l):
+        print("Initial strategies of all %s players:" % len(mixed_strategy_l))
+        for mixed_strategy in mixed_strategy_l:
+            print("%s," % mixed_strategy.round(4).tolist())
+
+    def eliminated(self, surviving_l, pure_strategies_num_l):
+        for i, (surviving, pures_num) in enumerate(
+            zip(surviving_l, pure_strategies_num_l)
+        ):
+            if len(surviving) < pures_num:
+                print(
+                    "Player %s: strictly dominated strategies eliminated, surviving"
+                    % (i + 1),
+                    (surviving + 1).tolist(),
+                )
+
+    def equilibrium(self, result):
+        for i, (mixed_strategy, payoff, regret_vector) in enumerate(
+            zip(result.equilibrium, result.payoffs, result.deviations)
+        ):
+            print(
+                "Player %s:" % (i + 1),
+                "Nash Eq.",
+                mixed_strategy.round(4).tolist(),
+                "Payoff",
+                round(payoff, 4),
+                "Deviation",
+                regret_vector.round(4).tolist(),
+            )
+        regret_sum_a = np.array(result.deviation_sums).round(4)
+        print(
+            "Deviation Sum:",
+            *regret_sum_a,
+            "Overall: %s" % np.round(regret_sum_a.sum(), 4)
+        )
+
+    def stopped(self, result):
+        print(
+            "Stopped by %s after %s iterations"
+            % (result.stop_reason, result.iterations_used)
+        )
+
+    def batch_deviation(self, regret_sum_overall):
+        print(
+            "Deviation Sum Overall: min %s, median %s, max %s"
+            % tuple(np.round(np.percentile(regret_sum_overall, [0, 50, 100]), 4))
+        )
+
+    def catalogue(self, catalogue):
+        for n, ne in enumerate(catalogue):
+            print("NE %s: hits %s" % (n + 1, ne["hits"]))
+            for i, (mixed_strategy, regret_vector) in enumerate(
+                zip(ne["equilibrium"], ne["deviation"])
+            ):
+                print(
+                    "Player %s:" % (i + 1),
+                    "Nash Eq.",
+                    mixed_strategy.round(4).tolist(),
+                    "Deviation",
+                    regret_vector.round(4).tolist(),
+                )
+
+    def symmetric_equilibrium(self, players_num, result):
+        print(
+            "All %s players:" % players_num,
+            "Nash Eq.",
+            result.equilibrium[0].round(4).tolist(),
+            "Payoff",
+            round(result.payoffs[0], 4),
+            "Deviation",
+            result.deviations[0].round(4).tolist(),
+        )
+
+
+class Recorder(object):
+    """
+    collect the path of mixed strategies and the regret sums of a player,
+    one record per iteration, under a recording policy:
+        "list": every record kept in growing lists (unbounded)
+        "off": nothing kept
+        "ring": the latest `capacity` records kept in a preallocated ring buffer
+        "array": the first `capacity` records kept in a preallocated array
+    and only every `every`-th iteration is recorded.
+    """
+
+    def __init__(self, pure_strategies_num, policy="list", every=1, capacity=None):
+        if policy not in ("list", "off", "ring", "array"):
+            raise ParameterError("unknown recording policy %s" % policy)
+        if policy in ("ring", "array") and not capacity:
+            raise ParameterError("recording policy %s needs a capacity" % policy)
+        self.pure_strategies_num = pure_strategies_num
+        self.policy = policy
+        self.every = max(1, int(every))
+        self.capacity = capacity
+        self.count = 0  # iterations seen
+        self.size = 0  # records taken
+        if policy == "list":
+            self.path_l = []
+            self.regret_sum_l = []
+        elif policy in ("ring", "array"):
+            self.path_a = np.zeros((capacity, pure_strategies_num))
+            self.regret_sum_a = np.zeros(capacity)
+
+    def append(self, mixed_strategy, regret_sum):
+        t = self.count
+        self.count += 1
+        if self.policy == "off" or t % self.every:
+            return
+        if self.policy == "list":
+            self.path_l.append(mixed_strategy)
+            self.regret_sum_l.append(regret_sum)
+        elif self.policy == "ring":
+            k = self.size % self.capacity
+            self.path_a[k] = mixed_strategy
+            self.regret_sum_a[k] = regret_sum
+        elif self.size < self.capacity:
+            self.path_a[self.size] = mixed_strategy
+            self.regret_sum_a[self.size] = regret_sum
+        else:
+            return
+        self.size += 1
+
+    def __ordered(self, a):
+        """the records in the order of iterations"""
+        if self.policy == "ring" and self.size > self.capacity:
+            return np.roll(a, -(self.size % self.capacity), axis=0)
+        return a[: min(self.size, len(a))]
+
+    def expand(self, pure_strategies_num, surviving):
+        """
+        a recorder of the same records on more pure strategies,
+        where the recorded ones are those on `surviving` and the others are zeros
+        """
+        path = self.path
+        recorder = Recorder(pure_strategies_num, "array", capacity=max(1, len(path)))
+        recorder.path_a[: len(path), surviving] = path
+        recorder.regret_sum_a[: len(path)] = self.regret_sums
+        recorder.size = len(path)
+        recorder.every = self.every
+        return recorder
+
+    @property
+    def path(self):
+        """recorded mixed strategies as a (records, pure_strategies_num) array"""
+        if self.policy == "list":
+            return np.array(self.path_l).reshape(-1, self.pure_strategies_num)
+        elif self.policy == "off":
+            return np.zeros((0, self.pure_strategies_num))
+        return self.__ordered(self.path_a)
+
+    @property
+    def regret_sums(self):
+        """recorded regret sums as an array"""
+        if self.policy == "list":
+            return np.array(self.regret_sum_l)
+        elif self.policy == "off":
+            return np.zeros(0)
+        return self.__ordered(self.regret_sum_a)
+
+    @property
+    def iterations(self):
+        """the iteration (starting from 0) of every record"""
+        first = max(0, self.size - self.capacity) if self.policy == "ring" else 0
+        return np.arange(first, self.size) * self.every
+
+
+class TrajectoryWriter(object):
+    """
+    stream the trajectory of a run into a directory of .npy files, chunk by chunk:
+        player_<i>.npy: the mixed strategies of player i, one row per iteration
+        regret_sums.npy: the regret sums of all players, one row per iteration
+        meta.json: how many iterations were written
+    the files are preallocated for `iterations` rows and filled through memory maps,
+    and only one chunk of rows is buffered in memory.
+    """
+
+    def __init__(self, path, pure_strategies_num_l, iterations, chunk=4096):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.pure_strategies_num_l = list(pure_strategies_num_l)
+        self.chunk = chunk
+        self.size = 0
+        self.path_mm_l = [
+            np.lib.format.open_memmap(
+                os.path.join(path, "player_%s.npy" % (i + 1)),
+                mode="w+",
+                shape=(iterations, g),
+            )
+            for i, g in enumerate(self.pure_strategies_num_l)
+        ]
+        self.regret_sum_mm = np.lib.format.open_memmap(
+            os.path.join(path, "regret_sums.npy"),
+            mode="w+",
+            shape=(iterations, len(self.pure_strategies_num_l)),
+        )
+        self.path_buf_l = [np.zeros((chunk, g)) for g in self.pure_strategies_num_l]
+        self.regret_sum_buf = np.zeros((chunk, len(self.pure_strategies_num_l)))
+        self.buffered = 0
+
+    def append(self, mixed_strategy_l, regret_sum_l):
+        for buf, mixed_strategy in zip(self.path_buf_l, mixed_strategy_l):
+            buf[self.buffered] = mixed_strategy
+        self.regret_sum_buf[self.buffered] = regret_sum_l
+        self.buffered += 1
+        if self.buffered == self.chunk:
+            self.flush()
+
+    def flush(self):
+        begin, end = self.size, self.size + self.buffered
+        for mm, buf in zip(self.path_mm_l, self.path_buf_l):
+            mm[begin:end] = buf[: self.buffered]
+        self.regret_sum_mm[begin:end] = self.regret_sum_buf[: self.buffered]
+        self.size = end
+        self.buffered = 0
+
+    def close(self):
+        self.flush()
+        for mm in self.path_mm_l + [self.regret_sum_mm]:
+            mm.flush()
+        self.path_mm_l = self.regret_sum_mm = None
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(
+                {"iterations": self.size, "pure_strategies_num": self.pure_strategies_num_l},
+                f,
+            )
+
+
+class Trajectory(object):
+    """
+    open the trajectory written by `TrajectoryWriter` without reading it into memory:
+        paths: one memory-mapped (iterations, g_i) array per player
+        regret_sums: the memory-mapped (iterations, n) array
+    """
+
+    def __init__(self, path):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        self.iterations = meta["iterations"]
+        self.pure_strategies_num_l = meta["pure_strategies_num"]
+        self.paths = [
+            np.load(os.path.join(path, "player_%s.npy" % (i + 1)), mmap_mode="r")[
+                : self.iterations
+            ]
+            for i in range(len(self.pure_strategies_num_l))
+        ]
+        self.regret_sums = np.load(
+            os.path.join(path, "regret_sums.npy"), mmap_mode="r"
+        )[: self.iterations]
+
+
+def downsample_path(points, tolerance, iterations=None):
+    """
+    the indexes of the points of a path to keep, by the Ramer-Douglas-Peucker method,
+    so that every point dropped is within `tolerance` of the polyline through the kept ones:
+    of the segment between the kept points around it, as the path is drawn,
+    or with `iterations`, of where the line is at the point's iteration,
+    for a path drawn over the iterations (synchronized distance)
+    points: a (records, d) array of the coordinates drawn, e.g. d = 2
+    iterations: the iteration of every point, increasing
+    all the segments of a level are split at once, vectorized over the whole path,
+    in O(log(records)) levels
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n <= 2:
+        return np.arange(n)
+    if iterations is not None:
+        t = np.asarray(iterations, dtype=np.float64)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    a, b = np.array([0]), np.array([n - 1])
+    while len(a):
+        inner = b - a - 1
+        a, b, inner = a[inner > 0], b[inner > 0], inner[inner > 0]
+        if not len(a):
+            break
+        # the inner points of all the segments, one after another
+        segment = np.repeat(np.arange(len(a)), inner)
+        offsets = np.cumsum(inner) - inner
+        index = np.arange(inner.sum()) - offsets[segment] + a[segment] + 1
+        start, chord = points[a][segment], (points[b] - points[a])[segment]
+        if iterations is None:
+            length2 = (chord**2).sum(axis=1)
+            w = ((points[index] - start) * chord).sum(axis=1)
+            w = np.clip(w / np.where(length2 > 0, length2, 1), 0, 1)
+        else:
+            w = (t[index] - t[a][segment]) / (t[b] - t[a])[segment]
+        error = np.sqrt(((points[index] - start - w[:, None] * chord) ** 2).sum(axis=1))
+        peak = np.maximum.reduceat(error, offsets)
+        # the first point at the peak of every segment
+        at_peak = np.flatnonzero(error == peak[segment])
+        _, first = np.unique(segment[at_peak], return_index=True)
+        m = index[at_peak[first]]
+        split = peak > tolerance
+        a, b, m = a[split], b[split], m[split]
+        # and at the middle too if the peak is near an end, so that every segment
+        # is at most 3/4 as long on the next level, and there are O(log(records)) levels
+        middle = (a + b) // 2
+        lopsided = 4 * np.abs(m - middle) > b - a
+        cuts = np.concatenate([m, middle[lopsided]])
+        keep[cuts] = True
+        ends = np.concatenate([a, b, cuts])
+        owner = np.concatenate(
+            [np.tile(np.arange(len(a)), 3), np.flatnonzero(lopsided)]
+        )
+        order = np.lexsort((ends, owner))
+        ends, owner = ends[order], owner[order]
+        same = owner[1:] == owner[:-1]
+        a, b = ends[:-1][same], ends[1:][same]
+    return np.flatnonzero(keep)
+
+
+class EquilibriumCache(object):
+    """
+    a cache of approximate NEs on local disk, shared by processes and kept across runs.
+    a game is fingerprinted by the sha256 of its regularized payoffs,
+    rounded to 6 decimals so that an affinely rescaled game aX+b hits the cache of X,
+    together with the shape (and neighbours) of every player's payoffs,
+    the parameters of the run and the initial strategies.
+    every entry is a .npz file named after its key, and the least recently used entries
+    are evicted once the cache is bigger than `max_bytes`.
+    """
+
+    def __init__(self, path=None, max_bytes=10**9):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "grm")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+
+    def key(self, game, params, init_strategies):
+        h = hashlib.sha256()
+        h.update(json.dumps(params, sort_keys=True, default=str).encode())
+        for player in game.players:
+            h.update(str((player.payoff_shape, player.neighbours)).encode())
+            pv = player.payoff_vector
+            # chunk by chunk, not to copy the whole payoff vector at once
+            for begin in range(0, pv.size, 2**20):
+                chunk = np.round(pv[begin : begin + 2**20].astype(np.float64), 6)
+                # no negative zeros, which have bytes of their own
+                h.update((chunk + 0.0).tobytes())
+        for x in init_strategies:
+            h.update(np.ascontiguousarray(x, dtype=np.float64).tobytes())
+        return h.hexdigest()
+
+    def __file(self, key):
+        return os.path.join(self.path, key + ".npz")
+
+    def get(self, key):
+        """
+        return the mixed strategies, regret vectors and the meta data stored on `key`,
+        or None on a miss
+        """
+        file_name = self.__file(key)
+        try:
+            with np.load(file_name) as data:
+                players_num = int(data["players_num"])
+                mixed_strategy_l = [data["equilibrium_%s" % i] for i in range(players_num)]
+                regret_vector_l = [data["deviation_%s" % i] for i in range(players_num)]
+                meta = json.loads(str(data["meta"]))
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            # a truncated or corrupted entry is a miss, and is dropped
+            try:
+                os.remove(file_name)
+            except OSError:
+                pass
+            return None
+        # a hit makes the entry the most recently used
+        os.utime(file_name)
+        return mixed_strategy_l, regret_vector_l, meta
+
+    def put(self, key, mixed_strategy_l, regret_vector_l, **meta):
+        arrays = {"players_num": len(mixed_strategy_l), "meta": json.dumps(meta)}
+        for i, (x, r) in enumerate(zip(mixed_strategy_l, regret_vector_l)):
+            arrays["equilibrium_%s" % i] = x
+            arrays["deviation_%s" % i] = r
+        # written aside and renamed, so other processes never read a partial entry
+        file_name_tmp = self.__file("%s.%s.tmp" % (key, os.getpid()))
+        np.savez(file_name_tmp, **arrays)
+        os.replace(file_name_tmp, self.__file(key))
+        self.evict()
+
+    def evict(self):
+        """remove the least recently used entries until the cache fits in `max_bytes`"""
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(".npz") or name.endswith(".tmp.npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort()
+        size = sum(e[1] for e in entries)
+        for _, entry_size, name in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                pass
+            size -= entry_size
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.path, name))
+
+
+class Instrumentation(object):
+    """
+    the instruments of a run, passed to `Game.run` (or `iterate`, `resolve`)
+    and reporting in structured records rather than prints:
+        phase_seconds: the time spent in every phase of the iterations,
+            "vertex_payoffs", "regret", "update" and "bookkeeping"
+            (recording, stopping rules, the step size schedule and the like)
+        progress: called every `progress_every` iterations with a progress record,
+            a dict of iteration, regret_sum, best_regret_sum, rate, seconds,
+            iterations_per_second and phase_seconds, all of which are kept in `records` too
+        profile: None, "cprofile" for the functions taking the most time,
+            or "tracemalloc" for the peak memory and the lines allocating the most of it
+    `summary` is the record of the whole run, once it is over.
+    the phases are timed by `tick`, which puts the time since the last tick into a phase.
+    """
+
+    PHASES = ("vertex_payoffs", "regret", "update", "bookkeeping")
+
+    def __init__(self, progress=None, progress_every=1000, profile=None, profile_top=20):
+        if profile not in (None, "cprofile", "tracemalloc"):
+            raise ParameterError("unknown profile mode %s" % profile)
+        self.progress = progress
+        self.progress_every = max(1, int(progress_every))
+        self.profile = profile
+        self.profile_top = profile_top
+        self.records = []
+        self.summary = None
+
+    def start(self):
+        self.phase_seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.records = []
+        self.summary = None
+        self.__profiler = None
+        self.__tracing = False
+        if self.profile == "cprofile":
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+        elif self.profile == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__tracing = True
+        self.time_start = self.time_last = time.perf_counter()
+
+    def tick(self, phase):
+        now = time.perf_counter()
+        self.phase_seconds[phase] += now - self.time_last
+        self.time_last = now
+
+    def iteration_done(self, iteration, regret_sum, best_regret_sum, rate):
+        if iteration % self.progress_every:
+            return
+        seconds = time.perf_counter() - self.time_start
+        record = {
+            "iteration": iteration,
+            "regret_sum": float(regret_sum),
+            "best_regret_sum": float(best_regret_sum),
+            "rate": rate,
+            "seconds": seconds,
+            "iterations_per_second": iteration / seconds if seconds > 0 else None,
+            "phase_seconds": dict(self.phase_seconds),
+        }
+        self.records.append(record)
+        if self.progress is not None:
+            self.progress(record)
+
+    def stop(self, iterations, stop_reason):
+        seconds = time.perf_counter() - self.time_start
+        self.summary = {
+            "iterations": iterations,
+            "stop_reason": stop_reason,
+            "seconds": seconds,
+            "iterations_per_second": iterations / seconds if seconds > 0 else None,
+            "phase_seconds": dict(self.phase_seconds),
+        }
+        if self.__profiler is not None:
+            self.__profiler.disable()
+            stats = pstats.Stats(self.__profiler).stats
+            top = sorted(stats.items(), key=lambda item: -item[1][3])[: self.profile_top]
+            self.summary["profile"] = [
+                {
+                    "function": "%s:%s(%s)" % function,
+                    "calls": nc,
+                    "total_seconds": tt,
+                    "cumulative_seconds": ct,
+                }
+                for function, (cc, nc, tt, ct, callers) in top
+            ]
+        if self.profile == "tracemalloc" and tracemalloc.is_tracing():
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            top = tracemalloc.take_snapshot().statistics("lineno")[: self.profile_top]
+            self.summary["memory"] = {
+                "peak_bytes": peak_bytes,
+                "top": [
+                    {
+                        "location": "%s:%s" % (s.traceback[0].filename, s.traceback[0].lineno),
+                        "size_bytes": s.size,
+                        "count": s.count,
+                    }
+                    for s in top
+                ],
+            }
+            if self.__tracing:
+                tracemalloc.stop()
+        return self.summary
+
+
+class Solver(object):
+    """
+    the update rule of mixed strategies, given the vertex payoff vector.
+    `step` works on a mixed strategy of shape (g,), or a batch of shape (starts, g),
+    and keeps the state it needs per player in `self.state`, reset for every run.
+    an averaging solver reports the average of its iterates as the approximate.
+    """
+
+    averaging = False
+
+    def reset(self, players_num):
+        self.state = [{} for _ in range(players_num)]
+
+    def step(self, player_index, x, v, regret_vector, rate):
+        raise NotImplementedError
+
+    def average(self, player_index):
+        return None
+
+
+class GRM(Solver):
+    """move along the regret vector, https://doi.org/10.1063/5.0012735"""
+
+    def step(self, player_index, x, v, regret_vector, rate):
+        x = x + rate * regret_vector
+        # transform it to point in simplex
+        return x / x.sum(axis=-1, keepdims=True)
+
+
+class FictitiousPlay(Solver):
+    """
+    the mixed strategy is the empirical frequency of the best responses played so far,
+    each of which responds to the others' frequencies. `rate` is not used.
+    """
+
+    def step(self, player_index, x, v, regret_vector, rate):
+        state = self.state[player_index]
+        t = state.get("t", 0) + 1
+        state["t"] = t
+        best_response = np.zeros_like(x)
+        np.put_along_axis(
+            best_response, np.argmax(v, axis=-1)[..., None], 1, axis=-1
+        )
+        return x + (best_response - x) / (t + 1)
+
+
+class Replicator(Solver):
+    """
+    discrete replicator dynamics: the probability of every pure strategy grows
+    in proportion to how much it beats the mixed strategy.
+    `rate` times the payoff range must stay below one, which holds on the default rate
+    for the regularized payoffs
+    """
+
+    def step(self, player_index, x, v, regret_vector, rate):
+        payoff = (x * v).sum(axis=-1, keepdims=True)
+        x = np.maximum(x * (1 + rate * (v - payoff)), 0)
+        return x / x.sum(axis=-1, keepdims=True)
+
+
+class RegretMatchingPlus(Solver):
+    """
+    regret-matching+: play in proportion to the cumulative regrets floored at zero,
+    and report the iterates averaged with linearly growing weights. `rate` is not used.
+    """
+
+    averaging = True
+
+    def step(self, player_index, x, v, regret_vector, rate):
+        state = self.state[player_index]
+        payoff = (x * v).sum(axis=-1, keepdims=True)
+        cumulative = np.maximum(state.get("cumulative", 0) + v - payoff, 0)
+        total = cumulative.sum(axis=-1, keepdims=True)
+        uniform = np.full_like(x, 1 / x.shape[-1])
+        x = np.where(total > 0, cumulative / np.where(total > 0, total, 1), uniform)
+        t = state.get("t", 0) + 1
+        state["t"] = t
+        state["cumulative"] = cumulative
+        state["average"] = state.get("average", 0) + t * x
+        return x
+
+    def average(self, player_index):
+        average = self.state[player_index]["average"]
+        return average / average.sum(axis=-1, keepdims=True)
+
+
+SOLVERS = {
+    "grm": GRM,
+    "fictitious_play": FictitiousPlay,
+    "replicator": Replicator,
+    "regret_matching_plus": RegretMatchingPlus,
+}
+
+
+def make_solver(solver):
+    """a `Solver` by its name in `SOLVERS`, or the given `Solver` itself"""
+    if isinstance(solver, Solver):
+        return solver
+    if solver not in SOLVERS:
+        raise ParameterError("unknown solver %s" % solver)
+    return SOLVERS[solver]()
+
+
+# the most pairs of supports to enumerate before switching to Lemke-Howson
+SUPPORT_ENUMERATION_MAX = 5000
+
+
+def support_enumeration(A, B, max_equilibria=None):
+    """
+    the NEs of the bimatrix game (A, B) by enumerating pairs of supports of equal size.
+    on each pair of supports, the mixed strategy of one player makes
+    the other player indifferent among its support, which is a linear system.
+    return a list of NEs, each of which is [row mixed strategy, column mixed strategy]
+    """
+    m, n = A.shape
+    eps = 1e-9
+    equilibria = []
+    for k in range(1, min(m, n) + 1):
+        # the linear system: payoffs on the support all equal to u, and probs sum to one
+        M = np.zeros((k + 1, k + 1))
+        M[:k, k] = -1
+        M[k, :k] = 1
+        rhs = np.zeros(k + 1)
+        rhs[k] = 1
+        for I in itertools.combinations(range(m), k):
+            for J in itertools.combinations(range(n), k):
+                M[:k, :k] = A[np.ix_(I, J)]
+                try:
+                    sol_y = np.linalg.solve(M, rhs)
+                except np.linalg.LinAlgError:
+                    continue
+                if (sol_y[:k] < -eps).any():
+                    continue
+                M[:k, :k] = B[np.ix_(I, J)].T
+                try:
+                    sol_x = np.linalg.solve(M, rhs)
+                except np.linalg.LinAlgError:
+                    continue
+                if (sol_x[:k] < -eps).any():
+                    continue
+                x = np.zeros(m)
+                x[list(I)] = sol_x[:k]
+                y = np.zeros(n)
+                y[list(J)] = sol_y[:k]
+                # no pure strategy outside the supports does better
+                if (A.dot(y) > sol_y[k] + eps * np.abs(A).max()).any():
+                    continue
+                if (x.dot(B) > sol_x[k] + eps * np.abs(B).max()).any():
+                    continue
+                equilibria.append([np.maximum(x, 0), np.maximum(y, 0)])
+                if max_equilibria is not None and len(equilibria) >= max_equilibria:
+                    return equilibria
+    return equilibria
+
+
+def _lemke_howson_pivot(tableau, basis, entering, lex_columns):
+    """
+    pivot the entering label into the basis by the minimum ratio test, return the leaving label.
+    ties are broken lexicographically on the columns `lex_columns` of the initial basis,
+    which leaves exactly one row, so that degenerate games do not cycle
+    """
+    column = tableau[:, entering]
+    rows = np.flatnonzero(column > 1e-12)
+    for j in [-1] + lex_columns:
+        ratios = tableau[rows, j] / column[rows]
+        rows = rows[ratios <= ratios.min() + 1e-12]
+        if len(rows) == 1:
+            break
+    row = int(rows[0])
+    tableau[row] /= tableau[row, entering]
+    for r in range(len(basis)):
+        if r != row:
+            tableau[r] -= tableau[r, entering] * tableau[row]
+    leaving = basis[row]
+    basis[row] = entering
+    return leaving
+
+
+def lemke_howson(A, B, dropped_label=0, max_pivots=10**5):
+    """
+    one NE of the bimatrix game (A, B) by Lemke-Howson pivoting.
+    labels 0..m-1 are the row pure strategies, and m..m+n-1 the column ones.
+    the polytope {x >= 0: B^T x <= 1} of the row player is the tableau [B^T | I | 1],
+    and {y >= 0: A y <= 1} of the column player is [I | A | 1],
+    so in both tableaux the column of a variable is its label.
+    starting from the artificial NE (0, 0), `dropped_label` enters a basis,
+    and the label leaving one basis enters the other, until the dropped label leaves.
+    the lexicographic ratio test makes the path end on degenerate games too,
+    and a GRMError is raised after `max_pivots` pivots all the same
+    return [row mixed strategy, column mixed strategy]
+    """
+    m, n = A.shape
+    # make all payoffs positive, which keeps the NEs
+    A = A - A.min() + 1
+    B = B - B.min() + 1
+    tableau_x = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    basis_x = list(range(m, m + n))
+    tableau_y = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    basis_y = list(range(m))
+    tableau_x = (tableau_x, basis_x, list(basis_x))
+    tableau_y = (tableau_y, basis_y, list(basis_y))
+    if dropped_label < m:
+        tableaux = [tableau_x, tableau_y]
+    else:
+        tableaux = [tableau_y, tableau_x]
+    entering = dropped_label
+    for k in range(max_pivots):
+        tableau, basis, lex_columns = tableaux[k % 2]
+        entering = _lemke_howson_pivot(tableau, basis, entering, lex_columns)
+        if entering == dropped_label:
+            break
+    else:
+        raise GRMError(
+            "Lemke-Howson from label %s did not end in %s pivots"
+            % (dropped_label, max_pivots)
+        )
+    tableau_x, tableau_y = tableau_x[0], tableau_y[0]
+    x = np.zeros(m)
+    for label, row in zip(basis_x, tableau_x):
+        if label < m:
+            x[label] = row[-1]
+    y = np.zeros(n)
+    for label, row in zip(basis_y, tableau_y):
+        if label >= m:
+            y[label - m] = row[-1]
+    return [x / x.sum(), y / y.sum()]
 
 
 class Player(object):
     def __init__(self, pure_strategies_num):
         pure_strategies_num = int(pure_strategies_num)
         if pure_strategies_num < 2:
-            print(
-                "ERROR: %s cannot be the number of strategies per player"
+            raise GameError(
+                "%s cannot be the number of strategies per player"
                 % pure_strategies_num
             )
-            sys.exit(1)
         self.pure_strategies_num = pure_strategies_num
         self.payoff_vector = None
-        self.payoff_vector_orig = None
+        # payoff_vector is kept as payoff_scale * (original payoffs) + payoff_offset,
+        # see `Game.run` for the regularization
+        self.payoff_scale = 1.0
+        self.payoff_offset = 0.0
+        # whether payoff_vector is within [-1000, 1000] already
+        self.payoff_regularized = False
+        # the players (indexes starting from 0) the payoff depends on, None for all of them
+        self.neighbours = None
+
+    def clear_collected_data(self, record="list", record_every=1, record_capacity=None):
+        """start collecting data anew under a recording policy, see `Recorder`"""
+        self.recorder = Recorder(
+            self.pure_strategies_num, record, record_every, record_capacity
+        )
+
+    @property
+    def path_l(self):
+        return self.recorder.path
 
-    def clear_collected_data(self):
-        self.regret_sum_l = []
-        self.path_l = []
+    @property
+    def regret_sum_l(self):
+        return self.recorder.regret_sums
+
+    @property
+    def payoff_vector_orig(self):
+        """the original payoffs, recovered from the regularized ones as a new array"""
+        if self.payoff_vector is None:
+            return None
+        return (self.payoff_vector - self.payoff_offset) / self.payoff_scale
+
+    def __set_payoff_vector(self, payoff_vector):
+        self.payoff_vector = payoff_vector
+        self.payoff_scale = 1.0
+        self.payoff_offset = 0.0
+        self.payoff_regularized = False
 
     def assign_random_payoff(self, po_min=-1000, po_max=1000):
-        pool = np.arange(po_min, po_max)
-        self.payoff_vector = np.random.choice(pool, self.game.product_space_size)
-        # backup the origin payoff vector for payoff caculation
-        self.payoff_vector_orig = np.copy(self.payoff_vector)
+        self.__set_payoff_vector(
+            self.game.rng.integers(po_min, po_max, math.prod(self.payoff_shape)).astype(
+                self.game.dtype
+            )
+        )
+
+    def assign_payoff_tensor(self, payoff_tensor, copy=True):
+        """
+        copy: False to keep an array of the game dtype as it is, e.g. a memory map,
+            which the regularization then rescales in place
+        """
+        payoff_tensor = (np.array if copy else np.asarray)(
+            payoff_tensor, dtype=self.game.dtype
+        )
+        if payoff_tensor.shape not in (
+            self.game.product_space_shape,
+            (self.game.product_space_size,),
+        ):
+            raise GameError(
+                "payoff tensor of shape %s for the product space of shape %s"
+                % (payoff_tensor.shape, self.game.product_space_shape)
+            )
+        self.neighbours = None
+        self.__set_payoff_vector(payoff_tensor.ravel())
+
+    def set_neighbours(self, neighbours):
+        """
+        make the payoff depend only on the players in `neighbours` (indexes starting from 1),
+        which must include the player itself, and the payoff tensor has one axis
+        per neighbour in that order. None for all the players
+        """
+        if neighbours is None:
+            self.neighbours = None
+            return
+        neighbours = tuple(int(j) - 1 for j in neighbours)
+        if (
+            len(set(neighbours)) != len(neighbours)
+            or self.id - 1 not in neighbours
+            or not all(0 <= j < self.game.players_num for j in neighbours)
+        ):
+            raise GameError(
+                "player %s cannot depend on players %s"
+                % (self.id, [j + 1 for j in neighbours])
+            )
+        self.neighbours = neighbours
+
+    def assign_local_payoff_tensor(self, neighbours, payoff_tensor, copy=True):
+        """
+        assign the payoff of a graphical game, which depends only on the players in
+        `neighbours` (see `set_neighbours`), as an array with one axis per neighbour.
+        it is all that is stored, so memory and time scale with the neighbourhood
+        rather than the whole product space
+        copy: see `assign_payoff_tensor`
+        """
+        self.set_neighbours(neighbours)
+        payoff_tensor = (np.array if copy else np.asarray)(
+            payoff_tensor, dtype=self.game.dtype
+        )
+        if payoff_tensor.shape != self.payoff_shape:
+            raise GameError(
+                "local payoff tensor of shape %s for the neighbours of shape %s"
+                % (payoff_tensor.shape, self.payoff_shape)
+            )
+        self.__set_payoff_vector(payoff_tensor.ravel())
 
     def assign_payoff(self, combi_str, payoff):
+        """
+        assign the payoff on a combination string,
+        or on a list of combination indexes with their payoffs at once
+        """
+        if self.neighbours is not None:
+            raise GameError(
+                "player %s has a local payoff tensor, see assign_local_payoff_tensor"
+                % self.id
+            )
         if self.payoff_vector is None:
-            self.payoff_vector = np.zeros(self.game.product_space_size)
-            # backup the origin payoff vector for payoff caculation
-            self.payoff_vector_orig = np.zeros(self.game.product_space_size)
-        combi_index = self.game.get_strategy_combination_index(combi_str)
+            self.__set_payoff_vector(
+                np.zeros(self.game.product_space_size, dtype=self.game.dtype)
+            )
+        if isinstance(combi_str, list):
+            combi_index = combi_str
+        else:
+            combi_index = self.game.get_strategy_combination_index(combi_str)
         if combi_index is not None:
+            # on the same scale as the payoffs there, regularized or not
+            payoff = self.payoff_scale * np.asarray(payoff) + self.payoff_offset
             self.payoff_vector[combi_index] = payoff
-            self.payoff_vector_orig[combi_index] = payoff
+            if np.abs(payoff).max() > 1000:
+                self.payoff_regularized = False
         else:
-            print("ERORR: combination string %s is wrong" % combi_str)
-            sys.exit(1)
-
-    def __vector_update(self, a, b, r):
-        a = a + r * b
-        a = a / a.sum()  # transform it to point in simplex
-        return a
-
-    def __randomize_mixed_strategy(self, n, str_max=100):
-        pool = np.arange(1, str_max)
-        str_ = np.random.choice(pool, n)
-        str_ = str_ / str_.sum()
+            raise GameError("combination string %s is wrong" % combi_str)
+
+    def __randomize_mixed_strategy(self, n, str_max=100, starts=None, rng=None):
+        """
+        a random mixed strategy, or `starts` of them stacked as a (starts, n) array,
+        drawn from `rng`, the game's by default
+        """
+        if rng is None:
+            rng = self.game.rng
+        size = n if starts is None else (starts, n)
+        str_ = rng.integers(1, str_max, size)
+        str_ = str_ / str_.sum(axis=-1, keepdims=True)
         str_ = str_.round(4)
-        str_[0] += 1 - str_.sum()  # in case the sum doesn't add up to the whole one
+        # in case the sum doesn't add up to the whole one
+        str_[..., 0] += 1 - str_.sum(axis=-1)
         return str_.astype(np.float64)
 
-    def init_mixed_strategies(self, init_strategies=None):
+    def init_mixed_strategies(self, init_strategies=None, rng=None):
+        """rng: the generator of the random initial strategy, the game's by default"""
         if init_strategies is None:
             self.mixed_strategy = self.__randomize_mixed_strategy(
-                self.pure_strategies_num
+                self.pure_strategies_num, rng=rng
             )
         else:
             if len(init_strategies) == self.pure_strategies_num:
                 self.mixed_strategy = np.array(init_strategies).astype(np.float64)
             else:
-                print(
-                    "Error: player %s with %s pures initialized to %s"
+                raise StrategyError(
+                    "player %s with %s pures initialized to %s"
                     % (self.id, self.pure_strategies_num, init_strategies)
                 )
-                sys.exit(1)
+
+    def init_batch_mixed_strategies(self, starts, init_strategies=None, rngs=None):
+        """
+        return `starts` mixed strategies as a (starts, pure_strategies_num) array
+        rngs: one generator per start to draw its random strategy from,
+            or None to draw them all from the game's generator
+        """
+        if init_strategies is None:
+            if rngs is not None:
+                return np.stack(
+                    [
+                        self.__randomize_mixed_strategy(self.pure_strategies_num, rng=r)
+                        for r in rngs
+                    ]
+                )
+            return self.__randomize_mixed_strategy(
+                self.pure_strategies_num, starts=starts
+            )
+        batch = np.array(init_strategies).astype(np.float64)
+        if batch.shape != (starts, self.pure_strategies_num):
+            raise StrategyError(
+                "player %s with %s pures initialized to %s batch strategies"
+                % (self.id, self.pure_strategies_num, batch.shape)
+            )
+        return batch
+
+    @property
+    def payoff_shape(self):
+        """the shape of the payoff tensor, one axis per player it depends on"""
+        if self.neighbours is None:
+            return self.game.product_space_shape
+        return tuple(self.game.players[j].pure_strategies_num for j in self.neighbours)
+
+    @property
+    def payoff_tensor(self):
+        """payoff vector viewed as an n-dimensional array, one axis per player
+        (per neighbour in a graphical game)
+        """
+        return self.payoff_vector.reshape(self.payoff_shape)
 
     def get_payoff(self, mixed_strategy):
-        "caculate payoff on the given mixed"
-        v = []
-        for j in np.arange(self.pure_strategies_num):
-            vertex_prob_dist = self.game.compute_joint_dist_on_vertex(self.id - 1, j)
-            a_vertex_payoff = vertex_prob_dist.dot(self.payoff_vector_orig)
-            v.append(a_vertex_payoff)
-        return mixed_strategy.dot(v)
-
-    def run_one_iteration(self, rate):
-        """the core of everything
-        time complexity: (n-1)g^n multiplications,
-        where g is the average of players' pure strategies number
+        """caculate payoff on the given mixed,
+        mapping the expected regularized payoff back to the original payoffs
         """
-        # step 1: evalute vertex payoff vector: \vec{v}
-        v = []
-        for j in np.arange(self.pure_strategies_num):
-            vertex_prob_dist = self.game.compute_joint_dist_on_vertex(self.id - 1, j)
-            a_vertex_payoff = vertex_prob_dist.dot(self.payoff_vector)
-            v.append(a_vertex_payoff)
+        payoff = mixed_strategy.dot(self.compute_vertex_payoffs("tensor"))
+        return float((payoff - self.payoff_offset) / self.payoff_scale)
 
+    def compute_vertex_payoffs(self, engine="tensor"):
+        """evalute vertex payoff vector: v_j is the payoff of pure strategy j
+        time complexity: about g^(n+1) multiplications with the "vertex" engine,
+        about g^n with the "tensor" engine, or g^d over the d neighbours in a graphical game
+        """
+        if engine == "tensor":
+            return self.game.compute_vertex_payoffs(
+                self.id - 1, self.payoff_tensor, self.neighbours
+            )
+        elif engine == "vertex":
+            if self.neighbours is not None:
+                raise UnsupportedError(
+                    "player %s has a local payoff tensor, no vertex engine"
+                    % self.id
+                )
+            v = []
+            for j in np.arange(self.pure_strategies_num):
+                vertex_prob_dist = self.game.compute_joint_dist_on_vertex(
+                    self.id - 1, j
+                )
+                a_vertex_payoff = vertex_prob_dist.dot(self.payoff_vector)
+                v.append(a_vertex_payoff)
+            return np.array(v)
+        else:
+            raise ParameterError("unknown engine %s" % engine)
+
+    def update_mixed_strategy(self, v, rate, normalized=False):
+        """
+        move the mixed strategy along the regret of the given vertex payoff vector.
+        normalized: step along the regret vector scaled to sum to one,
+            so that the step size is `rate` no matter how big the regret is
+        """
         # step 2: compute payoff
         payoff = self.mixed_strategy.dot(v)
 
         # step 3: compute regret_vector
         temp = v - payoff
         self.regret_vector = np.where(temp > 0, temp, 0)
+        instrument = self.game.instrument
+        if instrument is not None:
+            instrument.tick("regret")
 
         # step 4: collect stats: regret_sum and path
-        self.regret_sum_l.append(self.regret_vector.sum())
-        self.path_l.append(self.mixed_strategy)
+        self.recorder.append(self.mixed_strategy, self.regret_vector.sum())
+        if instrument is not None:
+            instrument.tick("bookkeeping")
 
         # step 5: update strategies
-        self.mixed_strategy = self.__vector_update(
-            self.mixed_strategy, self.regret_vector, rate
+        regret_vector = self.regret_vector
+        if normalized and regret_vector.sum() > 0:
+            regret_vector = regret_vector / regret_vector.sum()
+        self.mixed_strategy = self.game.solver.step(
+            self.id - 1, self.mixed_strategy, v, regret_vector, rate
+        )
+        if instrument is not None:
+            instrument.tick("update")
+
+    def run_one_iteration(self, rate, engine="tensor", normalized=False):
+        """the core of everything
+        time complexity: about g^(n+1) multiplications with the "vertex" engine,
+        about g^n with the "tensor" engine,
+        where g is the average of players' pure strategies number
+        """
+        # step 1: evalute vertex payoff vector: \vec{v}
+        v = self.compute_vertex_payoffs(engine)
+        if self.game.instrument is not None:
+            self.game.instrument.tick("vertex_payoffs")
+        # step 2 ~ 5: regret and update
+        self.update_mixed_strategy(v, rate, normalized)
+
+
+def _make_reporter(reporter):
+    if reporter == "console":
+        return ConsoleReporter()
+    return Reporter() if reporter is None else reporter
+
+
+def _make_seed_sequence(seed):
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def _regularize(payoffs):
+    """
+    rescale `payoffs` in place to [-1000, 1000] as a * payoffs + b,
+    which has the same Nash Eq., and return (a, b)
+    """
+    interval = float(payoffs.max()) - float(payoffs.min())
+    if interval > 0:
+        a = 2000 / interval
+        b = 1000 - a * float(payoffs.max())
+    else:
+        a = 1.0
+        b = 1000 - float(payoffs.max())
+    payoffs *= payoffs.dtype.type(a)
+    payoffs += payoffs.dtype.type(b)
+    return a, b
+
+
+def _spawn_seed_sequences(seed_sequence, n):
+    # the k-th child by a fixed key, unlike `SeedSequence.spawn`, which counts
+    # the children already handed out and gives new ones on every call
+    return [
+        np.random.SeedSequence(
+            seed_sequence.entropy,
+            spawn_key=tuple(seed_sequence.spawn_key) + (k,),
+            pool_size=seed_sequence.pool_size,
         )
+        for k in range(n)
+    ]
 
 
 class Game(object):
-    def __init__(self):
+    def __init__(self, dtype=np.float64, reporter="console", seed=None):
+        """
+        dtype: how the payoffs are stored, np.float32 takes half the memory of np.float64
+            at about 7 significant digits, which is plenty for payoffs regularized
+            to [-1000, 1000], and the contractions run in that precision too
+        reporter: where the game reports to as it goes, a `Reporter`,
+            "console" for a `ConsoleReporter`, or None to keep quiet
+        seed: of everything random in the game, an integer or a `np.random.SeedSequence`,
+            None for fresh entropy, see `spawn`
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ParameterError("payoffs cannot be stored as %s" % self.dtype)
+        self.reporter = _make_reporter(reporter)
+        self.seed_sequence = _make_seed_sequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
         self.players = []
         self.players_num = 0
         self.fig_dpi = 50
-        self.pure_product_space = None
+        self.product_space_shape = None
+        self.solver = GRM()
+        self.solver.reset(0)
+        # the approximate NE of the last run, see `resolve`
+        self.last_equilibrium = None
+        # the `Instrumentation` of the running iterations, if any
+        self.instrument = None
 
     def player_join(self, player):
-        if self.pure_product_space is None:
+        if self.product_space_shape is None:
             player.game = self
             player.id = self.players_num + 1
             self.players.append(player)
             self.players_num += 1
+            self.solver.reset(self.players_num)
         else:
-            print("ERORR: cannot join new players any more")
-            sys.exit(1)
+            raise GameError("cannot join new players any more")
 
-    def player_assign_random_payoff(self):
+    def spawn(self, n):
+        """
+        n independent random streams off the game's seed, as `np.random.SeedSequence`s,
+        e.g. one per batch start or worker. stream k is keyed by k alone, so every call
+        with the same seed spawns the same streams, and any of them can be drawn again
+        on its own
+        """
+        return _spawn_seed_sequences(self.seed_sequence, n)
+
+    def player_assign_random_payoff(self, neighbourhoods=None):
+        """
+        neighbourhoods: for a graphical game, the neighbours of every player,
+            see `Player.set_neighbours`, e.g. [(1, 2), (1, 2, 3), (2, 3)]
+        """
         self.__build_product_space_of_pures()
+        if neighbourhoods is not None:
+            if len(neighbourhoods) != self.players_num:
+                raise GameError(
+                    "%s players is given %s neighbourhoods"
+                    % (self.players_num, len(neighbourhoods))
+                )
+            for player, neighbours in zip(self.players, neighbourhoods):
+                player.set_neighbours(neighbours)
         for player in self.players:
             player.assign_random_payoff()
-        print("Payoff functions were randomized")
+        self.reporter.message("Payoff functions were randomized")
 
     def player_assign_payoff(self, player_index, combi_str, payoff):
         self.__build_product_space_of_pures()
@@ -138,51 +1326,467 @@ class Game(object):
         player = self.players[player_index - 1]
         player.assign_payoff(combi_str, payoff)
 
-    def get_strategy_combination_index(self, combi_str):
-        # this will be a terrible searching
-        for i, combi in enumerate(self.pure_product_space):
-            # strategy index starts from 1, and hence add 1
-            combi_str_inside = "".join(str(x + 1) for x in combi)
-            if combi_str == combi_str_inside:
-                return i
-        return None
-
-    def player_init_mixed_strategies(self, init_strategies=None):
-        if init_strategies is None:
-            # random
-            for player in self.players:
-                player.init_mixed_strategies()
-            print("Initial strategies were randomized")
-        else:
-            # custom
-            if len(init_strategies) != self.players_num:
-                print(
-                    "Error: %s players is given %s initial strategies"
-                    % (self.players_num, len(init_strategies))
-                )
-                sys.exit(1)
-            for i, player in enumerate(self.players):
-                player.init_mixed_strategies(init_strategies[i])
-            print("Initial strategies were customized")
-
-    def __build_product_space_of_pures(self):
+    def player_attach_payoff_vectors(self, payoff_vectors, neighbourhoods=None):
         """
-        create a list of tuples, each of which is the form of, e.g.
-            ordered (0, 2, 1, ...), where each entry represents the index of pure strategy.
-        each tuple can be seen as a combination of pure strategies.
-        all the tuples in the list form the product space of all players' pure strateges.
+        use the given payoff vectors, one per player in the order of the product space,
+        as they are without copying, e.g. views on shared memory.
+        they are supposed to be regularized already, see `iterate`
+        neighbourhoods: for a graphical game, see `player_assign_random_payoff`
         """
-        if self.pure_product_space is not None:
+        self.__build_product_space_of_pures()
+        if neighbourhoods is None:
+            neighbourhoods = [None] * self.players_num
+        for player, payoff_vector, neighbours in zip(
+            self.players, payoff_vectors, neighbourhoods
+        ):
+            player.set_neighbours(neighbours)
+            player.payoff_vector = payoff_vector
+            player.payoff_regularized = True
+
+    def get_strategy_combination_index(self, combi_str):
+        """
+        the index of a combination of pure strategies in the product space,
+        by the mixed-radix arithmetic on the strides of the product space.
+        the combination is given with strategy indexes starting from 1, either
+            a string of one digit per player, e.g. "132",
+            a string separated by commas or spaces, e.g. "1,3,12", for more than nine pures,
+            or a sequence of integers, e.g. (1, 3, 12)
+        return None if the combination is wrong
+        """
+        if isinstance(combi_str, str):
+            if "," in combi_str or " " in combi_str:
+                combi = combi_str.replace(",", " ").split()
+            else:
+                combi = list(combi_str)
+        else:
+            combi = list(combi_str)
+        if len(combi) != self.players_num:
+            return None
+        combi_index = 0
+        for x, pures_num, stride in zip(
+            combi, self.product_space_shape, self.product_space_strides
+        ):
+            try:
+                x = int(x)
+            except ValueError:
+                return None
+            # strategy index starts from 1, and hence minus 1
+            if not 1 <= x <= pures_num:
+                return None
+            combi_index += (x - 1) * stride
+        return combi_index
+
+    def set_payoff_tensor(self, player_index, payoff_tensor):
+        """
+        assign the whole payoff function of a player at once,
+        as an array in the shape of the product space (or flattened in its order)
+        """
+        self.__build_product_space_of_pures()
+        # player index starts from 0, and hence minus 1
+        player = self.players[player_index - 1]
+        player.assign_payoff_tensor(payoff_tensor)
+
+    def set_local_payoff_tensor(self, player_index, neighbours, payoff_tensor):
+        """
+        assign the payoff function of a player in a graphical game,
+        which depends only on the players in `neighbours` (indexes starting from 1,
+        the player itself included), as an array with one axis per neighbour in that order
+        """
+        self.__build_product_space_of_pures()
+        # player index starts from 0, and hence minus 1
+        player = self.players[player_index - 1]
+        player.assign_local_payoff_tensor(neighbours, payoff_tensor)
+
+    @property
+    def graphical(self):
+        """whether any player's payoff depends on only some of the players"""
+        return any(p.neighbours is not None for p in self.players)
+
+    def set_payoffs(self, payoffs):
+        """
+        assign the payoff functions of all players at once from a dict,
+        which maps a combination (see `get_strategy_combination_index`)
+        to the payoffs of all players, e.g. {"12": (-505, -350), ...}
+        """
+        self.__build_product_space_of_pures()
+        combi_index_l = []
+        for combi_str in payoffs:
+            combi_index = self.get_strategy_combination_index(combi_str)
+            if combi_index is None:
+                raise GameError("combination string %s is wrong" % (combi_str,))
+            combi_index_l.append(combi_index)
+        payoff_a = np.array(list(payoffs.values()), dtype=np.float64)
+        if payoff_a.shape != (len(combi_index_l), self.players_num):
+            raise GameError("every combination needs %s payoffs" % self.players_num)
+        for i, player in enumerate(self.players):
+            player.assign_payoff(combi_index_l, payoff_a[:, i])
+
+    def load_payoffs(self, path, mmap=True):
+        """
+        load the payoff functions of all players from a file by its extension:
+            .npy: one array of shape (players_num, *product space shape)
+                stacking the payoff tensors, memory-mapped unless `mmap` is False
+            .npz: one array per player named "payoff_1", "payoff_2", ...,
+                and "neighbours_i" along a local payoff tensor in a graphical game
+            .csv: long format of one row per combination, with a header row,
+                the strategy of every player (starting from 1), then the payoff of every player.
+                a strategy column named like strategy_1:3 states that player 1 has
+                3 pure strategies, which `save_payoffs` writes; if the header does not state
+                them for all players, the players joined already are taken,
+                or else every combination has to be in the file to tell them.
+                the combinations missing get payoff 0
+            .nfg: the Gambit normal form format, in the payoff or the outcome version
+        the players are joined as the file tells if there are none yet,
+        otherwise the file must fit their pure strategies numbers
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".npy":
+            self.__load_npy(path, mmap)
+        elif ext == ".npz":
+            self.__load_npz(path)
+        elif ext == ".csv":
+            self.__load_csv(path)
+        elif ext == ".nfg":
+            self.__load_nfg(path)
+        else:
+            raise ParameterError("unknown payoff file format %s" % ext)
+        self.reporter.message("Payoff functions were loaded from " + path)
+
+    def save_payoffs(self, path, fmt="%.12g", title=""):
+        """
+        save the original payoff functions of all players to a file by its extension,
+        see `load_payoffs` for the formats. only .npz keeps the local payoff tensors
+        of a graphical game, which the others would have to expand to the whole product space
+        fmt: how a payoff is written into .csv and .nfg files
+        title: the title of the game in a .nfg file
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in (".npy", ".npz", ".csv", ".nfg"):
+            raise ParameterError("unknown payoff file format %s" % ext)
+        if any(p.payoff_vector is None for p in self.players) or not self.players:
+            raise GameError("no payoffs to save")
+        if self.graphical and ext != ".npz":
+            raise UnsupportedError("graphical games can only be saved into .npz files")
+        if ext == ".npy":
+            out = np.lib.format.open_memmap(
+                path,
+                mode="w+",
+                dtype=self.dtype,
+                shape=(self.players_num,) + self.product_space_shape,
+            )
+            for i, player in enumerate(self.players):
+                out[i] = player.payoff_vector_orig.reshape(self.product_space_shape)
+            out.flush()
+            del out
+        elif ext == ".npz":
+            arrays = {}
+            for i, player in enumerate(self.players):
+                arrays["payoff_%s" % (i + 1)] = player.payoff_vector_orig.reshape(
+                    player.payoff_shape
+                )
+                if player.neighbours is not None:
+                    arrays["neighbours_%s" % (i + 1)] = np.array(player.neighbours) + 1
+            np.savez(path, **arrays)
+        elif ext == ".csv":
+            combi_a = np.indices(self.product_space_shape).reshape(self.players_num, -1)
+            payoff_a = np.stack([p.payoff_vector_orig for p in self.players])
+            header = ",".join(
+                [
+                    "strategy_%s:%s" % (i + 1, p.pure_strategies_num)
+                    for i, p in enumerate(self.players)
+                ]
+                + ["payoff_%s" % (i + 1) for i in range(self.players_num)]
+            )
+            np.savetxt(
+                path,
+                np.concatenate([combi_a + 1, payoff_a]).T,
+                fmt=["%d"] * self.players_num + [fmt] * self.players_num,
+                delimiter=",",
+                header=header,
+                comments="",
+            )
+        else:
+            # the first player's strategy changes the fastest in Gambit
+            payoff_a = np.stack(
+                [
+                    p.payoff_vector_orig.reshape(self.product_space_shape).ravel(
+                        order="F"
+                    )
+                    for p in self.players
+                ],
+                axis=1,
+            )
+            with open(path, "w") as f:
+                f.write(
+                    'NFG 1 R "%s" { %s } { %s }\n\n'
+                    % (
+                        title.replace('"', '\\"'),
+                        " ".join('"Player %s"' % p.id for p in self.players),
+                        " ".join(str(g) for g in self.product_space_shape),
+                    )
+                )
+                np.savetxt(f, payoff_a, fmt=fmt, delimiter=" ")
+
+    def __join_players_by_shape(self, shape):
+        """join players by the shape of the product space, or check the shape fits them"""
+        if self.players_num == 0:
+            for pures_num in shape:
+                self.player_join(Player(pures_num))
+        self.__build_product_space_of_pures()
+        if tuple(shape) != self.product_space_shape:
+            raise GameError(
+                "payoffs for the product space of shape %s, not %s"
+                % (tuple(shape), self.product_space_shape)
+            )
+
+    def __load_npy(self, path, mmap):
+        # copy-on-write, so that the regularization never writes back to the file
+        payoff_a = np.load(path, mmap_mode="c" if mmap else None)
+        if payoff_a.ndim < 3:
+            raise GameError(
+                "%s is of shape %s, not (players, *strategies)" % (path, payoff_a.shape)
+            )
+        self.__join_players_by_shape(payoff_a.shape[1:])
+        if payoff_a.shape[0] != self.players_num:
+            raise GameError(
+                "%s has payoffs for %s players, not %s"
+                % (path, payoff_a.shape[0], self.players_num)
+            )
+        for player, payoff_tensor in zip(self.players, payoff_a):
+            player.assign_payoff_tensor(payoff_tensor, copy=not mmap)
+
+    def __load_npz(self, path):
+        with np.load(path) as arrays:
+            players_num = sum(1 for name in arrays.files if name.startswith("payoff_"))
+            payoff_l = []
+            neighbours_l = []
+            for i in range(1, players_num + 1):
+                if "payoff_%s" % i not in arrays.files:
+                    raise GameError("%s has no payoff_%s" % (path, i))
+                payoff_l.append(arrays["payoff_%s" % i])
+                name = "neighbours_%s" % i
+                neighbours_l.append(arrays[name] if name in arrays.files else None)
+        if self.players_num == 0:
+            # the pure strategies numbers from the axes of the player's own strategies
+            shape = []
+            for i, payoff_tensor in enumerate(payoff_l):
+                neighbours = neighbours_l[i]
+                if payoff_tensor.ndim < 1:
+                    raise GameError("%s has a scalar payoff_%s" % (path, i + 1))
+                if neighbours is None:
+                    shape.append(payoff_tensor.shape[i])
+                else:
+                    axis = np.flatnonzero(np.asarray(neighbours) == i + 1)
+                    if len(axis) != 1:
+                        raise GameError(
+                            "player %s cannot depend on players %s"
+                            % (i + 1, list(neighbours))
+                        )
+                    shape.append(payoff_tensor.shape[axis[0]])
+            self.__join_players_by_shape(shape)
+        self.__build_product_space_of_pures()
+        if players_num != self.players_num:
+            raise GameError(
+                "%s has payoffs for %s players, not %s"
+                % (path, players_num, self.players_num)
+            )
+        for player, payoff_tensor, neighbours in zip(
+            self.players, payoff_l, neighbours_l
+        ):
+            if neighbours is None:
+                player.assign_payoff_tensor(payoff_tensor, copy=False)
+            else:
+                player.assign_local_payoff_tensor(neighbours, payoff_tensor, copy=False)
+
+    def __load_csv(self, path):
+        with open(path) as f:
+            header = f.readline().split(",")
+        table = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+        if table.shape[1] % 2 or table.shape[1] < 4:
+            raise GameError(
+                "%s has %s columns, not a strategy and a payoff per player"
+                % (path, table.shape[1])
+            )
+        players_num = table.shape[1] // 2
+        combi_a = table[:, :players_num].astype(np.int64) - 1
+        # the numbers of pure strategies stated in the header, e.g. strategy_1:3
+        stated = [
+            re.fullmatch(r"\s*strategy_\d+:(\d+)\s*", name)
+            for name in header[:players_num]
+        ]
+        if len(stated) == players_num and all(stated):
+            self.__join_players_by_shape([int(m.group(1)) for m in stated])
+        elif self.players_num == 0:
+            # inferred from the rows, which have to cover the whole product space,
+            # or the strategies of a player left out entirely would go unnoticed
+            shape = combi_a.max(axis=0) + 1
+            if (combi_a < 0).any() or len(np.unique(combi_a, axis=0)) != math.prod(
+                int(g) for g in shape
+            ):
+                raise GameError(
+                    "%s leaves out combinations, so the numbers of pure strategies "
+                    "must be stated in its header, e.g. strategy_1:%s"
+                    % (path, shape[0])
+                )
+            self.__join_players_by_shape(shape)
+        self.__build_product_space_of_pures()
+        if players_num != self.players_num:
+            raise GameError(
+                "%s has payoffs for %s players, not %s"
+                % (path, players_num, self.players_num)
+            )
+        if (combi_a < 0).any() or (combi_a >= self.product_space_shape).any():
+            raise GameError("%s has strategies out of range" % path)
+        combi_index = combi_a.dot(self.product_space_strides)
+        for i, player in enumerate(self.players):
+            payoff_vector = np.zeros(self.product_space_size, dtype=self.dtype)
+            payoff_vector[combi_index] = table[:, players_num + i]
+            player.assign_payoff_tensor(payoff_vector, copy=False)
+
+    def __load_nfg(self, path):
+        with open(path) as f:
+            text = f.read()
+        # the header is tokenized, and the payoffs after it are parsed in bulk
+        pattern = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]|[^\s{}"]+')
+        pos = 0
+
+        def token():
+            nonlocal pos
+            m = pattern.search(text, pos)
+            if m is None:
+                raise GameError("%s ends before the payoffs" % path)
+            pos = m.end()
+            return m.group()
+
+        def block():
+            """the tokens up to the matching "}", as nested lists"""
+            items = []
+            while True:
+                t = token()
+                if t == "}":
+                    return items
+                items.append(block() if t == "{" else t)
+
+        if [token(), token()] != ["NFG", "1"] or token() not in ("R", "D"):
+            raise GameError("%s is not a Gambit NFG file" % path)
+        token()  # the title
+        if token() != "{":
+            raise GameError("%s has no players" % path)
+        players_num = len(block())
+        if token() != "{":
+            raise GameError("%s has no strategies" % path)
+        # either the numbers of strategies, or the names of strategies per player
+        shape = [len(s) if isinstance(s, list) else int(s) for s in block()]
+        if len(shape) != players_num:
+            raise GameError("%s has strategies for %s players" % (path, len(shape)))
+        m = pattern.search(text, pos)
+        if m is not None and m.group().startswith('"'):
+            pos = m.end()  # the comment
+        body = text[pos:].strip()
+        if body.startswith("{"):
+            # outcome version: the outcomes, then the outcome of every combination
+            close = body.rindex("}")
+            outcome_l = [[0.0] * players_num]  # outcome 0 for no payoffs
+            for m in re.finditer(r'\{\s*"(?:[^"\\]|\\.)*"([^{}]*)\}', body[1:close]):
+                payoffs = self.__parse_numbers(m.group(1).replace(",", " "))
+                if len(payoffs) != players_num:
+                    raise GameError(
+                        "%s has an outcome of %s payoffs" % (path, len(payoffs))
+                    )
+                outcome_l.append(payoffs)
+            outcome_index = self.__parse_numbers(body[close + 1 :]).astype(np.int64)
+            if (outcome_index < 0).any() or (outcome_index >= len(outcome_l)).any():
+                raise GameError("%s refers to outcomes that do not exist" % path)
+            payoff_a = np.array(outcome_l)[outcome_index]
+        else:
+            payoff_a = self.__parse_numbers(body)
+            if len(payoff_a) % players_num:
+                raise GameError("%s has %s payoffs" % (path, len(payoff_a)))
+            payoff_a = payoff_a.reshape(-1, players_num)
+        self.__join_players_by_shape(shape)
+        if len(payoff_a) != self.product_space_size:
+            raise GameError(
+                "%s has payoffs for %s combinations, not %s"
+                % (path, len(payoff_a), self.product_space_size)
+            )
+        for i, player in enumerate(self.players):
+            # the first player's strategy changes the fastest in Gambit
+            player.assign_payoff_tensor(
+                payoff_a[:, i].reshape(self.product_space_shape, order="F")
+            )
+
+    @staticmethod
+    def __parse_numbers(text):
+        """numbers separated by white spaces, some of which may be rational like 3/2"""
+        tokens = text.split()
+        try:
+            return np.array(tokens, dtype=np.float64)
+        except ValueError:
+            try:
+                return np.array([float(Fraction(t)) for t in tokens])
+            except ValueError as e:
+                raise GameError("payoffs are not numbers: %s" % e) from e
+
+    def player_init_mixed_strategies(self, init_strategies=None):
+        if init_strategies is None:
+            # random
+            for player in self.players:
+                player.init_mixed_strategies()
+            self.reporter.message("Initial strategies were randomized")
+        else:
+            # custom
+            if len(init_strategies) != self.players_num:
+                raise StrategyError(
+                    "%s players is given %s initial strategies"
+                    % (self.players_num, len(init_strategies))
+                )
+            for i, player in enumerate(self.players):
+                player.init_mixed_strategies(init_strategies[i])
+            self.reporter.message("Initial strategies were customized")
+
+    def __build_product_space_of_pures(self):
+        """
+        the product space of all players' pure strateges is represented by its shape,
+        one axis per player, and never materialized.
+        each combination of pure strategies is a tuple of the form, e.g.
+            ordered (0, 2, 1, ...), where each entry represents the index of pure strategy,
+        and the combinations are ordered row-major like `itertools.product`,
+        so a payoff vector can be reshaped into a payoff tensor without copying.
+        """
+        if self.product_space_shape is not None:
             # product space was built
             return
-        temp_l = []
         if self.players_num < 2:
-            print("ERROR: %s player, no game" % self.players_num)
-            sys.exit(1)
-        for player in self.players:
-            temp_l.append(set(range(player.pure_strategies_num)))
-        self.pure_product_space = list(itertools.product(*temp_l))
-        self.product_space_size = len(self.pure_product_space)
+            raise GameError("%s player, no game" % self.players_num)
+        self.product_space_shape = tuple(p.pure_strategies_num for p in self.players)
+        # python integers, which do not overflow in big graphical games
+        self.product_space_size = math.prod(self.product_space_shape)
+        # how far apart two combinations are in the product space
+        # when one player's strategy index differs by one
+        self.product_space_strides = tuple(
+            math.prod(self.product_space_shape[i + 1 :]) for i in range(self.players_num)
+        )
+
+    @property
+    def pure_product_space(self):
+        """all the combinations of pure strategies, generated one by one"""
+        if self.product_space_shape is None:
+            return None
+        return self.iter_product_space()
+
+    def iter_product_space(self):
+        """generate the combinations of pure strategies in the order of the product space"""
+        return itertools.product(*(range(g) for g in self.product_space_shape))
+
+    def ravel_combination(self, combi):
+        """the index of a combination (strategy indexes starting from 0) in the product space"""
+        return int(np.dot(combi, self.product_space_strides))
+
+    def unravel_combination_index(self, combi_index):
+        """the combination (strategy indexes starting from 0) on an index of the product space"""
+        return tuple(
+            int(x) for x in np.unravel_index(combi_index, self.product_space_shape)
+        )
 
     def compute_joint_dist_on_vertex(self, player_index, pure_strategy_index):
         """
@@ -190,53 +1794,237 @@ class Game(object):
         1. the player on `player_index` changes the probability to 1 (hence on the "vertex" of simplex)
             for the pure strategy on `pure_strategy_index`.
         2. meanwhile, the other players keep theirs unchanged.
-        index i: for player
-        index j: for pure strategies of player i
-        index k: for the combination of pure strategies in `pure_product_space` and `prob_dict`
-        time complexity: (n-1)g^(n-1) multiplications
-        """
-        prob_dist = np.zeros(self.product_space_size)
-        for k, combi in enumerate(self.pure_product_space):
-            # ignore those combination without `pure_strategy_index` in it,
-            # leaving its prob. slot in `prob_dist` to zero
-            if combi[player_index] != pure_strategy_index:
+        the dist is the outer product of all players' mixed strategies,
+        where the vertex of the player on `player_index` takes the place of its mixed strategy,
+        flattened in the order of the product space.
+        those combinations without `pure_strategy_index` in it are left to zero.
+        time complexity: about g^n multiplications
+        """
+        prob_dist = np.ones(1)
+        for i, player in enumerate(self.players):
+            if i == player_index:
+                factor = np.zeros(player.pure_strategies_num)
+                factor[pure_strategy_index] = 1
+            else:
+                factor = player.mixed_strategy
+            prob_dist = np.outer(prob_dist, factor).ravel()
+        return prob_dist
+
+    def compute_vertex_payoffs(self, player_index, payoff_tensor, neighbours=None):
+        """
+        return the vertex payoff vector of the player on `player_index`,
+        i.e. the expected payoff of each of its pure strategies
+        while the other players keep their mixed strategies.
+        equivalent to `compute_joint_dist_on_vertex(player_index, j).dot(payoff_vector)`
+        for every j, but done as one tensor contraction:
+        the axes of the other players are contracted one by one with their mixed strategies,
+        from the last axis to the first so that the remaining axes keep their positions.
+        neighbours: the players (indexes starting from 0) on the axes of `payoff_tensor`,
+            all the players by default
+        time complexity: about g^n multiplications, or g^d over d neighbours
+        """
+        if neighbours is None:
+            neighbours = range(self.players_num)
+        t = payoff_tensor
+        for axis in range(len(neighbours) - 1, -1, -1):
+            i = neighbours[axis]
+            if i == player_index:
                 continue
-            prob = 1
-            # there are g^(n-1) combinations surviving here
-            for i, j in enumerate(combi):
-                if i == player_index and j == pure_strategy_index:
-                    # equivalent to multiplying by 1, which is the vertex prob.
-                    pass
+            x = self.players[i].mixed_strategy.astype(t.dtype, copy=False)
+            t = np.tensordot(t, x, axes=([axis], [0]))
+        return t
+
+    def run_joint_iteration(self, rate, order="gauss-seidel", normalized=False):
+        """
+        one iteration of all players sharing the partial products of mixed strategies.
+        the payoff tensor of player i is viewed as a (prefix, g_i, suffix) block,
+        where prefix is the outer product of the mixed strategies of players before i,
+        and suffix is that of players after i.
+        the suffix products are built once from the back,
+        the prefix product grows by one player at a time along the sweep.
+        order:
+            "gauss-seidel": each player sees the strategies updated earlier in the same sweep,
+                just like calling `run_one_iteration` player by player
+            "jacobi": all players are updated simultaneously on the same strategies
+        time complexity: about ng^n multiplications, instead of n(n-1)g^n
+        in a graphical game, the products would span the whole product space,
+        so every player contracts its own local payoff tensor instead
+        """
+        if order not in ("gauss-seidel", "jacobi"):
+            raise ParameterError("unknown update order %s" % order)
+        if self.graphical:
+            v_l = []
+            for player in self.players:
+                v = player.compute_vertex_payoffs("tensor")
+                if self.instrument is not None:
+                    self.instrument.tick("vertex_payoffs")
+                if order == "gauss-seidel":
+                    player.update_mixed_strategy(v, rate, normalized)
                 else:
-                    # real deal: there are n-1 multiplications
-                    prob *= self.players[i].mixed_strategy[j]
-            prob_dist[k] = prob
-        return prob_dist
+                    v_l.append(v)
+            for player, v in zip(self.players, v_l):
+                player.update_mixed_strategy(v, rate, normalized)
+            return
 
-    def plot_2(self):
-        # if any player is not using two pure strategies, quit plotting
-        for player in self.players:
-            if np.array(player.path_l).shape[1] != 2:
-                print("ERROR: at least one player is not using TWO pure strategies")
-                sys.exit(1)
+        suffix_l = [np.ones(1)] * self.players_num
+        for i in range(self.players_num - 2, -1, -1):
+            suffix_l[i] = np.outer(
+                self.players[i + 1].mixed_strategy, suffix_l[i + 1]
+            ).ravel()
 
-        try:
-            import matplotlib.pyplot as plt
-        except:
-            print("ERROR: you haven't installed matplotlib packages")
-            sys.exit(1)
+        prefix = np.ones(1)
+        v_l = []
+        for i, player in enumerate(self.players):
+            block = player.payoff_vector.reshape(prefix.size, -1)
+            # in the dtype of the payoffs, or numpy would convert the whole block
+            v = prefix.astype(block.dtype, copy=False).dot(block)
+            v = v.reshape(player.pure_strategies_num, -1).dot(
+                suffix_l[i].astype(block.dtype, copy=False)
+            )
+            if self.instrument is not None:
+                self.instrument.tick("vertex_payoffs")
+            if order == "gauss-seidel":
+                player.update_mixed_strategy(v, rate, normalized)
+            else:
+                v_l.append(v)
+            # the prefix over all players would be as big as the product space
+            if i < self.players_num - 1:
+                prefix = np.outer(prefix, player.mixed_strategy).ravel()
 
-        plt.figure(figsize=(16, 8))
-        ax = plt.gca()
+        for player, v in zip(self.players, v_l):
+            player.update_mixed_strategy(v, rate, normalized)
 
-        for player in self.players:
-            xy = np.array(player.path_l)
-            ax.plot(xy[:, 0], alpha=1, zorder=2)
+    def __plot_paths(self, trajectory, max_points):
+        """
+        the (iterations, path) to draw for every player, either recorded in memory,
+        or from a `Trajectory` (or its directory), taking every k-th row of the records
+        (of the memory maps) so that no more than `max_points` rows of each path are read
+        """
+        if trajectory is None:
+            paths = []
+            for player in self.players:
+                iterations, path = player.recorder.iterations, player.recorder.path
+                step = max(1, -(-len(path) // max_points))
+                paths.append((iterations[::step], path[::step]))
+            return paths
+        if isinstance(trajectory, str):
+            trajectory = Trajectory(trajectory)
+        step = max(1, -(-trajectory.iterations // max_points))
+        iterations = np.arange(0, trajectory.iterations, step)
+        return [(iterations, np.array(path[::step])) for path in trajectory.paths]
 
-        plt.tight_layout()
-        self.__random_diagram_file_name()
-        plt.savefig(self.plot_file_name, bbox_inches="tight", dpi=self.fig_dpi)
-        plt.show()
+    def __plot_curves(self, trajectory, max_points, tolerance):
+        """
+        the curves to draw for every player, in the coordinates they are drawn in,
+        simplified by `downsample_path` within `tolerance` there:
+            2 pure strategies: (iterations, probability of the first strategy)
+            3 pure strategies: the point in the triangle of the simplex
+            more pure strategies: the projection onto the first two principal components
+                of the player's path, along with the projected vertices of the simplex
+        return one dict per player with keys "kind", "x", "y", "color", "label",
+        and "vertices" and "explained" for a projection
+        """
+        curves = []
+        for player, (iterations, path) in zip(
+            self.players, self.__plot_paths(trajectory, max_points)
+        ):
+            g = player.pure_strategies_num
+            curve = {
+                "kind": min(g, 4),
+                # the same color for a player in every panel
+                "color": "C%s" % ((player.id - 1) % 10),
+                "label": "Player %s" % player.id,
+            }
+            if g == 2:
+                points = np.stack([iterations, path[:, 0]], axis=1).astype(np.float64)
+            elif g == 3:
+                points = np.stack(self.__barycentric_to_cartesian(path), axis=1)
+            else:
+                # an orthonormal projection, so the distances shrink and the bound holds
+                center = path.mean(axis=0) if len(path) else np.full(g, 1 / g)
+                _, s, vt = np.linalg.svd(path - center, full_matrices=False)
+                components = np.zeros((2, g))
+                components[: len(vt[:2])] = vt[:2]
+                points = (path - center).dot(components.T)
+                curve["vertices"] = (np.eye(g) - center).dot(components.T)
+                variance = s**2
+                curve["explained"] = (
+                    variance[:2] / variance.sum() if variance.sum() > 0 else np.zeros(2)
+                )
+            keep = downsample_path(
+                points, tolerance, iterations if g == 2 else None
+            )
+            curve["x"], curve["y"] = points[keep, 0], points[keep, 1]
+            curves.append(curve)
+        return curves
+
+    def __draw_2(self, ax, curves):
+        for curve in curves:
+            ax.plot(curve["x"], curve["y"], color=curve["color"], alpha=1, zorder=2)
+
+    def __draw_3(self, ax, curves):
+        from matplotlib.patches import Polygon
+
+        triangle = Polygon(
+            np.array([[0, 0], [np.sqrt(2) / 2, np.sqrt(6) / 2], [np.sqrt(2), 0]]),
+            fc="gray",
+            alpha=0.1,
+        )
+        ax.add_artist(triangle)
+        ax.set_aspect("equal")
+        ax.set_xlim(0, np.sqrt(2))
+        ax.set_ylim(0, np.sqrt(6) / 2)
+        for curve in curves:
+            ax.plot(curve["x"], curve["y"], color=curve["color"], alpha=1, zorder=2)
+
+    def __draw_projection(self, ax, curve):
+        vertices = curve["vertices"]
+        ax.scatter(vertices[:, 0], vertices[:, 1], c="gray", alpha=0.5, zorder=1)
+        for j, (x, y) in enumerate(vertices):
+            ax.annotate(str(j + 1), (x, y), color="gray")
+        ax.plot(curve["x"], curve["y"], color=curve["color"], alpha=1, zorder=2)
+        ax.set_xlabel("PC1 (%.0f%%)" % (100 * curve["explained"][0]))
+        ax.set_ylabel("PC2 (%.0f%%)" % (100 * curve["explained"][1]))
+        ax.set_title(curve["label"])
+
+    def __save_figure(self, fig, kind, path):
+        """
+        save the figure to `path`, or to ./game_<seed>_<kind>.png by default,
+        where <seed> is a digest of the game's seed, so the same seed draws the same file
+        """
+        if path is None:
+            digest = hashlib.sha256(repr(self.seed_sequence.entropy).encode())
+            path = "./game_%s_%s.png" % (digest.hexdigest()[:8], kind)
+        fig.tight_layout()
+        fig.savefig(path, bbox_inches="tight", dpi=self.fig_dpi)
+        self.plot_file_name = path
+        self.reporter.message("Plot diagram: " + path)
+        return path
+
+    def __figure(self, figsize):
+        """a figure drawn without pyplot, hence without any GUI backend"""
+        try:
+            from matplotlib.figure import Figure
+        except ImportError as e:
+            raise UnsupportedError("you haven't installed matplotlib packages") from e
+        return Figure(figsize=figsize)
+
+    def plot_2(self, trajectory=None, max_points=10**5, tolerance=10**-3, path=None):
+        """
+        draw the trajectories recorded by the last run,
+        or those of a trajectory file (see `Trajectory`), at most `max_points` per player,
+        for games where all players use two pure strategies, see `plot`
+        return the path of the diagram
+        """
+        # if any player is not using two pure strategies, quit plotting
+        for player in self.players:
+            if player.pure_strategies_num != 2:
+                raise UnsupportedError(
+                    "at least one player is not using TWO pure strategies"
+                )
+        fig = self.__figure((16, 8))
+        self.__draw_2(fig.gca(), self.__plot_curves(trajectory, max_points, tolerance))
+        return self.__save_figure(fig, "plot_2", path)
 
     def __barycentric_to_cartesian(self, strategy_a):
         """transform simplex on R^3 into a triangle on R^2"""
@@ -244,85 +2032,672 @@ class Game(object):
         barycentric_y = np.array([0, np.sqrt(6) / 2, 0]).T
         return strategy_a.dot(barycentric_x), strategy_a.dot(barycentric_y)
 
-    def plot_3(self):
+    def plot_3(self, trajectory=None, max_points=10**5, tolerance=10**-3, path=None):
+        """
+        draw the trajectories recorded by the last run,
+        or those of a trajectory file (see `Trajectory`), at most `max_points` per player,
+        for games where all players use three pure strategies, see `plot`
+        return the path of the diagram
+        """
         # if any player uses less than three pure strategies, quit plotting
         for player in self.players:
-            if np.array(player.path_l).shape[1] != 3:
-                print("ERROR: at least one player is not using THREE pure strategies")
-                sys.exit(1)
-        try:
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as mpatches
-        except:
-            print("ERROR: you haven't installed matplotlib packages")
-            sys.exit(1)
-
-        plt.figure(figsize=(8, 8))
-        ax = plt.gca()
-        triangle = mpatches.Polygon(
-            np.array([[0, 0], [np.sqrt(2) / 2, np.sqrt(6) / 2], [np.sqrt(2), 0]]),
-            fc="gray",
-            alpha=0.1,
-        )
-        ax.add_artist(triangle)
+            if player.pure_strategies_num != 3:
+                raise UnsupportedError(
+                    "at least one player is not using THREE pure strategies"
+                )
+        fig = self.__figure((8, 8))
+        self.__draw_3(fig.gca(), self.__plot_curves(trajectory, max_points, tolerance))
+        return self.__save_figure(fig, "plot_3", path)
 
-        plt.axis("scaled")
-        plt.xlim(0, np.sqrt(2))
-        plt.ylim(0, np.sqrt(6) / 2)
+    def plot(self, trajectory=None, max_points=10**5, tolerance=10**-3, path=None):
+        """
+        draw the trajectories of any game, in one panel per kind of players:
+            the players using two pure strategies together over the iterations, as `plot_2`,
+            those using three together in the triangle of the simplex, as `plot_3`,
+            and every player using more in a panel of its own,
+                projected onto the first two principal components of its path (PCA)
+        trajectory, max_points: the last run, or a trajectory file, see `plot_2`
+        tolerance: every path is downsampled so that no point dropped is farther
+            than `tolerance` from the line drawn, in the coordinates of its panel,
+            e.g. in probability over the iterations, see `downsample_path`
+        path: of the PNG file, see `__save_figure` for the default
+        the figure is drawn without pyplot, so nothing is shown and it works headless
+        return the path of the diagram
+        """
+        curves = self.__plot_curves(trajectory, max_points, tolerance)
+        panels = []
+        for kind in (2, 3):
+            group = [curve for curve in curves if curve["kind"] == kind]
+            if group:
+                panels.append((kind, group))
+        panels += [(4, curve) for curve in curves if curve["kind"] == 4]
+        columns = min(3, len(panels))
+        rows = -(-len(panels) // columns)
+        fig = self.__figure((8 * columns, 8 * rows))
+        for k, (kind, group) in enumerate(panels):
+            ax = fig.add_subplot(rows, columns, k + 1)
+            if kind == 2:
+                self.__draw_2(ax, group)
+                ax.set_title(", ".join(curve["label"] for curve in group))
+            elif kind == 3:
+                self.__draw_3(ax, group)
+                ax.set_title(", ".join(curve["label"] for curve in group))
+            else:
+                self.__draw_projection(ax, group)
+        return self.__save_figure(fig, "plot", path)
 
+    def __regularize_payoffs(self):
+        """
+        regularize the payoff to [-1000, 1000] for accuracy
+        because payoff matrix X has the same Nash Eq. as aX+b.
+        the payoffs are rescaled in place, and a and b are folded into
+        the scale and offset of the player to recover the original payoffs.
+        players regularized already are left as they are, unless edits went out of range
+        """
         for player in self.players:
-            x_a, y_a = self.__barycentric_to_cartesian(np.array(player.path_l))
-            ax.plot(x_a, y_a, alpha=1, zorder=2)
-
-        plt.tight_layout()
-        self.__random_diagram_file_name()
-        plt.savefig(self.plot_file_name, bbox_inches="tight", dpi=self.fig_dpi)
-        plt.show()
-
-    def __random_diagram_file_name(self):
-        samples = "abcdefghijklmnopqrstuvwxyz"
-        samples = samples + samples.upper() + "0123456789"
-        self.plot_file_name = "./game_" + "".join(random.sample(samples, 6)) + ".png"
-        print("Plot diagram: " + self.plot_file_name)
-
-    def run(self, iterations=10**4 * 6, rate=10**-5):
-        """run iterations"""
-        # show initial strategy
-        print("Initial strategies of all %s players:" % self.players_num)
-        for _, player in enumerate(self.players):
-            print("%s," % player.mixed_strategy.round(4).tolist())
+            if player.payoff_regularized:
+                continue
+            a, b = _regularize(player.payoff_vector)
+            player.payoff_scale = a * player.payoff_scale
+            player.payoff_offset = a * player.payoff_offset + b
+            player.payoff_regularized = True
+
+    def __batch_update(self, player_index, x, v, rate):
+        """the update of `update_mixed_strategy` on a (starts, g) batch of mixed strategies"""
+        payoff = np.einsum("kg,kg->k", x, v)
+        regret = np.maximum(v - payoff[:, None], 0)
+        x = self.solver.step(player_index, x, v, regret, rate)
+        return x, regret
+
+    def __batch_local_vertex_payoffs(self, player_index, x_l, dtype=None):
+        """
+        the vertex payoff vectors of a player on a batch of mixed strategies,
+        contracting its payoff tensor over its neighbours only, for graphical games
+        dtype: of the contraction, that of the payoffs by default
+        """
+        player = self.players[player_index]
+        neighbours = player.neighbours
+        if neighbours is None:
+            neighbours = tuple(range(self.players_num))
+        payoff_tensor = player.payoff_tensor.astype(
+            dtype or player.payoff_vector.dtype, copy=False
+        )
+        # one label per axis of the payoff tensor, and one more for the starts
+        starts_label = len(neighbours)
+        operands = [payoff_tensor, list(range(len(neighbours)))]
+        for axis, j in enumerate(neighbours):
+            if j != player_index:
+                x = x_l[j].astype(payoff_tensor.dtype, copy=False)
+                operands += [x, [starts_label, axis]]
+        operands.append([starts_label, neighbours.index(player_index)])
+        return np.einsum(*operands, optimize=True)
+
+    def __batch_vertex_payoffs(self, x_l, dtype=None):
+        """
+        the vertex payoff vectors of all players on a batch of mixed strategies,
+        with the prefix/suffix products of `run_joint_iteration` vectorized over the starts
+        dtype: of the contraction, that of the payoffs by default
+        """
+        if self.graphical:
+            return [
+                self.__batch_local_vertex_payoffs(i, x_l, dtype)
+                for i in range(self.players_num)
+            ]
+        starts = x_l[0].shape[0]
+        suffix_l = [np.ones((starts, 1))] * self.players_num
+        for i in range(self.players_num - 2, -1, -1):
+            suffix_l[i] = np.einsum("ka,kb->kab", x_l[i + 1], suffix_l[i + 1])
+            suffix_l[i] = suffix_l[i].reshape(starts, -1)
+        prefix = np.ones((starts, 1))
+        v_l = []
+        for i, player in enumerate(self.players):
+            block = player.payoff_vector.astype(
+                dtype or player.payoff_vector.dtype, copy=False
+            ).reshape(prefix.shape[1], player.pure_strategies_num, -1)
+            v_l.append(
+                np.einsum(
+                    "kp,pgs,ks->kg",
+                    prefix.astype(block.dtype, copy=False),
+                    block,
+                    suffix_l[i].astype(block.dtype, copy=False),
+                    optimize=True,
+                )
+            )
+            if i < self.players_num - 1:
+                prefix = np.einsum("ka,kb->kab", prefix, x_l[i]).reshape(starts, -1)
+        return v_l
+
+    def run_batch(
+        self,
+        starts=1000,
+        iterations=10**4 * 6,
+        rate=10**-5,
+        order="gauss-seidel",
+        init_strategies=None,
+        solver="grm",
+        cache=None,
+    ):
+        """
+        run iterations from `starts` initial strategies all at once.
+        the mixed strategies of player i are kept as a (starts, g_i) array,
+        and every iteration advances all the starts with the prefix/suffix products
+        of `run_joint_iteration`, vectorized over the starts.
+        init_strategies: None for random ones, start k drawn from the k-th stream
+            of `spawn`, the same on every call, or one (starts, g_i) array per player
+        solver: a name in `SOLVERS` or a `Solver`, see `iterate`
+        cache: an `EquilibriumCache` to look the results up in, and to store them into
+        return two lists, each with one (starts, g_i) array per player:
+            the approximate NE of every start, and its deviation (regret vector)
+        """
+        if order not in ("gauss-seidel", "jacobi"):
+            raise ParameterError("unknown update order %s" % order)
+        if init_strategies is None:
+            init_strategies = [None] * self.players_num
+        elif len(init_strategies) != self.players_num:
+            raise StrategyError(
+                "%s players is given %s initial strategies"
+                % (self.players_num, len(init_strategies))
+            )
+        # every start draws from a stream of its own, the same however many starts
+        rngs = None
+        if any(init is None for init in init_strategies):
+            rngs = [np.random.default_rng(s) for s in self.spawn(starts)]
+        x_l = [
+            player.init_batch_mixed_strategies(starts, init_strategies[i], rngs)
+            for i, player in enumerate(self.players)
+        ]
 
         self.iterations = iterations
-        print(
-            "=========== Nash Equilibrium Approximation: %s iterations ============"
-            % self.iterations
+        self.reporter.header(
+            "Nash Equilibrium Approximation: %s starts, %s iterations"
+            % (starts, self.iterations)
         )
 
-        # clear collected data for new run()
-        for player in self.players:
-            player.clear_collected_data()
+        self.__regularize_payoffs()
+        if cache is not None:
+            key = cache.key(
+                self,
+                {
+                    "run": "run_batch",
+                    "dtype": self.dtype.str,
+                    "starts": starts,
+                    "iterations": iterations,
+                    "rate": rate,
+                    "order": order,
+                    "solver": self.__solver_name(solver),
+                },
+                x_l,
+            )
+            hit = cache.get(key)
+            if hit is not None:
+                self.reporter.message("Found in cache")
+                mixed_strategy_l, regret_vector_l, _ = hit
+                self.__report_batch_deviation(regret_vector_l)
+                return mixed_strategy_l, regret_vector_l
+
+        self.solver = make_solver(solver)
+        self.solver.reset(self.players_num)
+
+        mixed_strategy_l = [np.copy(x) for x in x_l]
+        regret_vector_l = [np.zeros_like(x) for x in x_l]
+        regret_sum_overall_old = np.full(starts, 10.0**10)
+        for _ in range(iterations):
+            regret_l = []
+            if order == "jacobi":
+                v_l = self.__batch_vertex_payoffs(x_l)
+                for i, v in enumerate(v_l):
+                    x_l[i], regret_vector = self.__batch_update(i, x_l[i], v, rate)
+                    regret_l.append(regret_vector)
+            elif self.graphical:
+                for i in range(self.players_num):
+                    v = self.__batch_local_vertex_payoffs(i, x_l)
+                    x_l[i], regret_vector = self.__batch_update(i, x_l[i], v, rate)
+                    regret_l.append(regret_vector)
+            else:
+                # suffix products over the strategies of the previous iteration,
+                # and the prefix product over those updated in this iteration
+                suffix_l = [np.ones((starts, 1))] * self.players_num
+                for i in range(self.players_num - 2, -1, -1):
+                    suffix_l[i] = np.einsum("ka,kb->kab", x_l[i + 1], suffix_l[i + 1])
+                    suffix_l[i] = suffix_l[i].reshape(starts, -1)
+                prefix = np.ones((starts, 1))
+                for i, player in enumerate(self.players):
+                    block = player.payoff_vector.reshape(
+                        prefix.shape[1], player.pure_strategies_num, -1
+                    )
+                    v = np.einsum(
+                        "kp,pgs,ks->kg",
+                        prefix.astype(block.dtype, copy=False),
+                        block,
+                        suffix_l[i].astype(block.dtype, copy=False),
+                        optimize=True,
+                    )
+                    x_l[i], regret_vector = self.__batch_update(i, x_l[i], v, rate)
+                    regret_l.append(regret_vector)
+                    if i < self.players_num - 1:
+                        prefix = np.einsum("ka,kb->kab", prefix, x_l[i])
+                        prefix = prefix.reshape(starts, -1)
+
+            regret_sum_overall_cur = np.sum([r.sum(axis=1) for r in regret_l], axis=0)
+            # every start keeps its own minimum of overall regret sum
+            improved = regret_sum_overall_cur < regret_sum_overall_old
+            if improved.any():
+                for i in range(self.players_num):
+                    mixed_strategy_l[i][improved] = x_l[i][improved]
+                    regret_vector_l[i][improved] = regret_l[i][improved]
+                regret_sum_overall_old = np.where(
+                    improved, regret_sum_overall_cur, regret_sum_overall_old
+                )
+
+        if self.solver.averaging:
+            average_l = [self.solver.average(i) for i in range(self.players_num)]
+            v_l = self.__batch_vertex_payoffs(average_l)
+            regret_average_l = [
+                np.maximum(v - np.einsum("kg,kg->k", x, v)[:, None], 0)
+                for x, v in zip(average_l, v_l)
+            ]
+            regret_sum_average = np.sum([r.sum(axis=1) for r in regret_average_l], axis=0)
+            improved = regret_sum_average < regret_sum_overall_old
+            for i in range(self.players_num):
+                mixed_strategy_l[i][improved] = average_l[i][improved]
+                regret_vector_l[i][improved] = regret_average_l[i][improved]
+            regret_sum_overall_old = np.where(
+                improved, regret_sum_average, regret_sum_overall_old
+            )
 
-        # regularize the payoff to [-1000, 1000] for accuracy
-        # because payoff matrix X has the same Nash Eq. as aX+b
+        if cache is not None:
+            cache.put(key, mixed_strategy_l, regret_vector_l)
+        self.__report_batch_deviation(regret_vector_l)
+        return mixed_strategy_l, regret_vector_l
+
+    def __report_batch_deviation(self, regret_vector_l):
+        self.reporter.batch_deviation(
+            np.sum([r.sum(axis=1) for r in regret_vector_l], axis=0)
+        )
+
+    def __solver_name(self, solver):
+        """how a solver goes into the key of `EquilibriumCache`"""
+        return solver if isinstance(solver, str) else type(solver).__name__
+
+    def eliminate_dominated(self):
+        """
+        iterated elimination of strictly dominated pure strategies:
+        a pure strategy is dropped if another one of the same player pays strictly more
+        on every combination of the others' surviving pure strategies,
+        which never appears in any NE.
+        return the surviving pure strategies (starting from 0) of every player
+        """
+        surviving_l = [np.arange(g) for g in self.product_space_shape]
+        eliminated = True
+        while eliminated:
+            eliminated = False
+            for i, player in enumerate(self.players):
+                neighbours = player.neighbours
+                if neighbours is None:
+                    neighbours = tuple(range(self.players_num))
+                tensor = player.payoff_tensor[
+                    np.ix_(*[surviving_l[j] for j in neighbours])
+                ]
+                M = np.moveaxis(tensor, neighbours.index(i), 0)
+                M = M.reshape(len(surviving_l[i]), -1)
+                # dominate[k, j]: pure k strictly dominates pure j
+                dominate = (M[:, None, :] > M[None, :, :]).all(axis=-1)
+                dominated = dominate.any(axis=0)
+                if dominated.any():
+                    surviving_l[i] = surviving_l[i][~dominated]
+                    eliminated = True
+        return surviving_l
+
+    def __iterate_reduced(self, iterations, rate, **kwargs):
+        """
+        `iterate` on the game reduced to the surviving strategies.
+        a player left with only one pure strategy is fixed to it and folded out of the game,
+        and if a single player is left free, its surviving pure strategies pay all the same,
+        so its current strategy on them is as good as any.
+        a trajectory file is streamed by the reduced game, and expanded afterwards
+        """
+        trajectory_file = kwargs.pop("trajectory_file")
+        reduced_file = None
+        free_l = [i for i, a in enumerate(self.surviving_strategies) if len(a) > 1]
+        self.solver = make_solver(kwargs["solver"])
+        self.stop_reason = "eliminated"
+        self.iterations_used = 0
+        if len(free_l) > 1:
+            reduced = Game(self.dtype)
+            for i in free_l:
+                reduced.player_join(Player(len(self.surviving_strategies[i])))
+            for k, i in enumerate(free_l):
+                player = self.players[i]
+                neighbours = player.neighbours
+                if neighbours is None:
+                    neighbours = tuple(range(self.players_num))
+                tensor = player.payoff_tensor[
+                    np.ix_(*[self.surviving_strategies[j] for j in neighbours])
+                ]
+                fixed_axes = tuple(
+                    axis for axis, j in enumerate(neighbours) if j not in free_l
+                )
+                tensor = tensor.squeeze(axis=fixed_axes)
+                if player.neighbours is None:
+                    reduced.set_payoff_tensor(k + 1, tensor)
+                else:
+                    reduced.set_local_payoff_tensor(
+                        k + 1,
+                        [free_l.index(j) + 1 for j in neighbours if j in free_l],
+                        tensor,
+                    )
+                mixed_strategy = player.mixed_strategy[self.surviving_strategies[i]]
+                if mixed_strategy.sum() > 0:
+                    mixed_strategy = mixed_strategy / mixed_strategy.sum()
+                else:
+                    mixed_strategy = np.full(len(mixed_strategy), 1 / len(mixed_strategy))
+                reduced.players[k].init_mixed_strategies(mixed_strategy)
+            if trajectory_file is not None:
+                reduced_file = os.path.join(trajectory_file, "reduced")
+            reduced.iterate(iterations, rate, trajectory_file=reduced_file, **kwargs)
+            self.solver = reduced.solver
+            self.stop_reason = reduced.stop_reason
+            self.iterations_used = reduced.iterations_used
+
+        mixed_strategy_l = []
+        for i, (player, surviving) in enumerate(
+            zip(self.players, self.surviving_strategies)
+        ):
+            mixed_strategy = np.zeros(player.pure_strategies_num)
+            if len(free_l) > 1 and i in free_l:
+                reduced_player = reduced.players[free_l.index(i)]
+                mixed_strategy[surviving] = reduced_player.mixed_strategy
+                player.recorder = reduced_player.recorder.expand(
+                    player.pure_strategies_num, surviving
+                )
+            else:
+                mixed_strategy[surviving] = player.mixed_strategy[surviving]
+                player.clear_collected_data("off")
+            if mixed_strategy.sum() > 0:
+                mixed_strategy = mixed_strategy / mixed_strategy.sum()
+            else:
+                mixed_strategy[surviving] = 1 / len(surviving)
+            mixed_strategy_l.append(mixed_strategy)
+        for i, player in enumerate(self.players):
+            player.init_mixed_strategies(mixed_strategy_l[i])
+        if trajectory_file is not None:
+            self.__expand_trajectory(trajectory_file, reduced_file, free_l)
+        regret_vector_l = self.compute_regret_vectors(mixed_strategy_l)
+        self.__keep_solution(mixed_strategy_l, regret_vector_l)
+        return mixed_strategy_l, regret_vector_l
+
+    def __expand_trajectory(self, path, reduced_path, free_l):
+        """
+        write the trajectory of the reduced game in `reduced_path` into `path`
+        on all the pure strategies, as `Recorder.expand` does in memory,
+        with the players folded out fixed to their strategies all along.
+        no reduced game leaves a trajectory of no iterations
+        """
+        iterations = 0
+        if reduced_path is not None:
+            reduced = Trajectory(reduced_path)
+            iterations = reduced.iterations
+        writer = TrajectoryWriter(
+            path, [p.pure_strategies_num for p in self.players], iterations
+        )
+        for i, (player, surviving) in enumerate(
+            zip(self.players, self.surviving_strategies)
+        ):
+            path_mm = writer.path_mm_l[i]
+            if i not in free_l or reduced_path is None:
+                path_mm[:, surviving] = player.mixed_strategy[surviving]
+                continue
+            k = free_l.index(i)
+            for begin in range(0, iterations, writer.chunk):
+                end = min(begin + writer.chunk, iterations)
+                path_mm[begin:end, surviving] = reduced.paths[k][begin:end]
+                writer.regret_sum_mm[begin:end, i] = reduced.regret_sums[begin:end, k]
+        writer.size = iterations
+        writer.close()
+        if reduced_path is not None:
+            del reduced
+            shutil.rmtree(reduced_path)
+
+    def __keep_solution(self, mixed_strategy_l, regret_vector_l):
+        """keep the approximate NE of this run for `resolve` to start from"""
+        self.last_equilibrium = [np.copy(x) for x in mixed_strategy_l]
+        # the regret sums are on the regularized scales of the time
+        self.last_regret_sums = [float(r.sum()) for r in regret_vector_l]
+        self.last_payoff_scales = [p.payoff_scale for p in self.players]
+
+    def compute_regret_vectors(self, mixed_strategy_l):
+        """
+        the regret vectors of all players on the given mixed strategies,
+        on the payoffs as they are (regularized ones after `run`).
+        the players' own mixed strategies, if initialized at all, are kept as they were
+        """
+        mixed_strategy_keep_l = [
+            getattr(p, "mixed_strategy", None) for p in self.players
+        ]
+        for player, mixed_strategy in zip(self.players, mixed_strategy_l):
+            player.mixed_strategy = mixed_strategy
+        regret_vector_l = []
         for player in self.players:
-            pv = player.payoff_vector
-            interval = pv.max() - pv.min()
-            if interval > 0:
-                a = 2000 / interval
-                b = 1000 - a * pv.max()
-                pv = a * pv + b
-                player.payoff_vector = pv
+            v = player.compute_vertex_payoffs("tensor")
+            regret_vector_l.append(np.maximum(v - player.mixed_strategy.dot(v), 0))
+        for player, mixed_strategy in zip(self.players, mixed_strategy_keep_l):
+            if mixed_strategy is None:
+                del player.mixed_strategy
             else:
-                player.payoff_vector.fill(1000)
+                player.mixed_strategy = mixed_strategy
+        return regret_vector_l
+
+    def verify(self, profile, chunk_size=2**22):
+        """
+        certify how close to a NE strategy profiles are, on the original payoffs.
+        profile: the mixed strategies of all players, one (g_i,) array per player,
+            or K profiles at once as one (K, g_i) array per player, e.g. from `run_batch`.
+            a `Result` or an NE of the catalogue of `explore` is taken too
+        the vertex payoffs of all players on all the profiles are evaluated in one pass
+        of the prefix/suffix products of `run_batch`, in float64 whatever the dtype,
+        a chunk of profiles at a time to keep the products within `chunk_size` numbers.
+        a player's best-response gap is the most it gains by a pure strategy of its own,
+        and the certified epsilon is the largest gap plus a bound on the rounding errors:
+            of the payoffs stored, e.g. the float32 ones, or after the regularization,
+            and of the sums of the contraction, about sum(g_i) float64 roundings deep
+        return a `Certificate`
+        """
+        if isinstance(profile, Result):
+            profile = profile.equilibrium
+        elif isinstance(profile, dict):
+            profile = profile["equilibrium"]
+        if len(profile) != self.players_num:
+            raise StrategyError(
+                "%s players is given %s strategies" % (self.players_num, len(profile))
+            )
+        if any(p.payoff_vector is None for p in self.players):
+            raise GameError("no payoffs to verify on")
+        x_l = [np.asarray(x, dtype=np.float64) for x in profile]
+        single = all(x.ndim == 1 for x in x_l)
+        if single:
+            x_l = [x[None, :] for x in x_l]
+        for player, x in zip(self.players, x_l):
+            if x.ndim != 2 or x.shape != (len(x_l[0]), player.pure_strategies_num):
+                raise StrategyError(
+                    "player %s with %s pures is given strategies of shape %s"
+                    % (player.id, player.pure_strategies_num, x.shape)
+                )
+            if (x < -1e-9).any() or (np.abs(x.sum(axis=1) - 1) > 1e-6).any():
+                raise StrategyError(
+                    "player %s is given strategies off the simplex" % player.id
+                )
+        x_l = [np.maximum(x, 0) for x in x_l]
+        x_l = [x / x.sum(axis=1, keepdims=True) for x in x_l]
+
+        # the biggest payoff vector in the products is that of a whole player
+        chunk = max(1, chunk_size // max(p.payoff_vector.size for p in self.players))
+        v_l = [[] for _ in self.players]
+        for k in range(0, len(x_l[0]), chunk):
+            for i, v in enumerate(
+                self.__batch_vertex_payoffs([x[k : k + chunk] for x in x_l], np.float64)
+            ):
+                v_l[i].append(v)
+        v_l = [np.concatenate(v) for v in v_l]
+
+        gaps, payoffs, best_responses, error_bound = [], [], [], []
+        eps = np.finfo(np.float64).eps
+        for player, x, v in zip(self.players, x_l, v_l):
+            payoff = np.einsum("kg,kg->k", x, v)
+            gaps.append(np.maximum(v.max(axis=1) - payoff, 0) / player.payoff_scale)
+            payoffs.append((payoff - player.payoff_offset) / player.payoff_scale)
+            best_responses.append(v.argmax(axis=1))
+            # the payoffs are within [-1000, 1000] once regularized
+            if player.payoff_regularized:
+                payoff_max = 1000.0
+            else:
+                payoff_max = float(np.abs(player.payoff_vector).max())
+            neighbours = player.neighbours or range(self.players_num)
+            depth = sum(self.players[j].pure_strategies_num for j in neighbours)
+            depth += len(neighbours) + 2
+            # a payoff stored with a rounding of relative eps on both sides of the gap
+            stored = np.finfo(player.payoff_vector.dtype).eps * payoff_max
+            summed = depth * eps / (1 - depth * eps) * payoff_max
+            error_bound.append(2 * (stored + summed) / player.payoff_scale)
+        gaps = np.stack(gaps, axis=1)
+        payoffs = np.stack(payoffs, axis=1)
+        best_responses = np.stack(best_responses, axis=1)
+        error_bound = np.array(error_bound)
+        epsilon = (gaps + error_bound).max(axis=1)
+        if single:
+            return Certificate(
+                float(epsilon[0]), gaps[0], payoffs[0], best_responses[0], error_bound
+            )
+        return Certificate(epsilon, gaps, payoffs, best_responses, error_bound)
+
+    def __run_iteration(self, rate, engine, order, normalized):
+        """one iteration of all players"""
+        if engine == "joint":
+            self.run_joint_iteration(rate, order, normalized)
+        elif order == "jacobi":
+            v_l = [p.compute_vertex_payoffs(engine) for p in self.players]
+            if self.instrument is not None:
+                self.instrument.tick("vertex_payoffs")
+            for player, v in zip(self.players, v_l):
+                player.update_mixed_strategy(v, rate, normalized)
+        else:
+            for player in self.players:
+                player.run_one_iteration(rate, engine, normalized)
+
+    def iterate(
+        self,
+        iterations,
+        rate,
+        engine="tensor",
+        order="gauss-seidel",
+        tol=None,
+        patience=None,
+        time_budget=None,
+        schedule="constant",
+        rate_decay=10**-4,
+        record="list",
+        record_every=1,
+        record_capacity=None,
+        trajectory_file=None,
+        solver="grm",
+        eliminate=False,
+        instrument=None,
+    ):
+        """
+        the iterations of `run` on the regularized payoffs, without any output.
+        players are left with their mixed strategies at the minimum of overall regret sum,
+        return the mixed strategies and the regret vectors at that minimum.
+        the iterations stop early on whichever comes first:
+            tol: the overall regret sum is no more than it
+            patience: so many iterations go by without a new minimum of overall regret sum
+            time_budget: so many seconds have passed
+        and `stop_reason` and `iterations_used` tell why and when they stopped.
+        schedule: the step size of iteration t
+            "constant": always `rate`
+            "decay": rate / (1 + rate_decay * t)
+            "backtrack": halved (down to rate / 2) whenever the overall regret sum goes up,
+                and growing by 1% per iteration (up to 10 * rate) otherwise
+            "normalized": the regret vectors are scaled to sum to one,
+                so every step moves `rate` on the simplex (try a bigger rate, e.g. 10**-3)
+        record: how the path of every player is recorded for plotting, see `Recorder`,
+            every `record_every`-th iteration and at most `record_capacity` records
+            ("array" defaults to the capacity for all the iterations)
+        trajectory_file: a directory to stream the full trajectory into,
+            see `TrajectoryWriter`, and open it afterwards with `Trajectory`
+        solver: how the mixed strategies are updated, a name in `SOLVERS` or a `Solver`.
+            for an averaging solver, the average of the iterates is the approximate
+            if it deviates less than the best iterate
+        eliminate: iterate on the game reduced by `eliminate_dominated`,
+            and map the approximate back with zeros on the eliminated strategies
+            (the recorded paths are those of the reduced game, padded with zeros)
+        instrument: an `Instrumentation` for the time of every phase, progress records
+            and profiling, the summary of which is in `instrument.summary` afterwards
+        """
+        if order not in ("gauss-seidel", "jacobi"):
+            raise ParameterError("unknown update order %s" % order)
+        if schedule not in ("constant", "decay", "backtrack", "normalized"):
+            raise ParameterError("unknown step size schedule %s" % schedule)
+
+        if eliminate:
+            self.surviving_strategies = self.eliminate_dominated()
+            if sum(len(a) for a in self.surviving_strategies) < sum(
+                self.product_space_shape
+            ):
+                return self.__iterate_reduced(
+                    iterations,
+                    rate,
+                    engine=engine,
+                    order=order,
+                    tol=tol,
+                    patience=patience,
+                    time_budget=time_budget,
+                    schedule=schedule,
+                    rate_decay=rate_decay,
+                    record=record,
+                    record_every=record_every,
+                    record_capacity=record_capacity,
+                    trajectory_file=trajectory_file,
+                    solver=solver,
+                    instrument=instrument,
+                )
+
+        self.solver = make_solver(solver)
+        self.solver.reset(self.players_num)
+
+        # clear collected data for new run()
+        if record == "array" and record_capacity is None:
+            record_capacity = -(-iterations // max(1, int(record_every)))
+        for player in self.players:
+            player.clear_collected_data(record, record_every, record_capacity)
+
+        if trajectory_file is not None:
+            writer = TrajectoryWriter(
+                trajectory_file, [p.pure_strategies_num for p in self.players], iterations
+            )
 
         # here goes the iteration
+        self.instrument = instrument
+        if instrument is not None:
+            instrument.start()
+        time_start = time.time()
+        self.stop_reason = "iterations"
         regret_sum_overall_old = 10**10  # super big number to start with
-        for _ in range(iterations):
-            """time complexity: n(n-1)g^n multiplications
-            multiprocessing would be nice here, supposedly reducing O(n^2g^n) to O(ng^n)
+        regret_sum_overall_pre = regret_sum_overall_old
+        iteration_best = 0
+        rate_cur = rate
+        for t in range(iterations):
+            """time complexity: about ng^n multiplications with the "tensor" engine,
+            and the "joint" engine shares the partial products among players
             """
-            for player in self.players:
-                player.run_one_iteration(rate)
+            if schedule == "decay":
+                rate_cur = rate / (1 + rate_decay * t)
+            if trajectory_file is not None:
+                mixed_strategy_pre_l = [p.mixed_strategy for p in self.players]
+            self.__run_iteration(rate_cur, engine, order, schedule == "normalized")
+            self.iterations_used = t + 1
+            if trajectory_file is not None:
+                writer.append(
+                    mixed_strategy_pre_l, [p.regret_vector.sum() for p in self.players]
+                )
 
             regret_sum_overall_cur = np.sum(
                 [p.regret_vector.sum() for p in self.players]
@@ -333,33 +2708,900 @@ class Game(object):
                 mixed_strategy_l = [p.mixed_strategy for p in self.players]
                 regret_vector_l = [p.regret_vector for p in self.players]
                 regret_sum_overall_old = regret_sum_overall_cur
+                iteration_best = t
+            if schedule == "backtrack":
+                if regret_sum_overall_cur > regret_sum_overall_pre:
+                    rate_cur = max(rate_cur / 2, rate / 2)
+                else:
+                    rate_cur = min(rate_cur * 1.01, rate * 10)
+            regret_sum_overall_pre = regret_sum_overall_cur
+            if instrument is not None:
+                instrument.tick("bookkeeping")
+                instrument.iteration_done(
+                    t + 1, regret_sum_overall_cur, regret_sum_overall_old, rate_cur
+                )
+
+            if tol is not None and regret_sum_overall_cur <= tol:
+                self.stop_reason = "tol"
+                break
+            if patience is not None and t - iteration_best >= patience:
+                self.stop_reason = "patience"
+                break
+            if time_budget is not None and time.time() - time_start >= time_budget:
+                self.stop_reason = "time_budget"
+                break
+
+        if trajectory_file is not None:
+            writer.close()
+        if instrument is not None:
+            instrument.stop(self.iterations_used, self.stop_reason)
+        self.instrument = None
+
+        if self.solver.averaging:
+            average_l = [self.solver.average(i) for i in range(self.players_num)]
+            regret_average_l = self.compute_regret_vectors(average_l)
+            if np.sum([r.sum() for r in regret_average_l]) < regret_sum_overall_old:
+                mixed_strategy_l, regret_vector_l = average_l, regret_average_l
 
         # reset players with their mixed at minimum to calculate payoff at approximate
         for i, player in enumerate(self.players):
             player.init_mixed_strategies(mixed_strategy_l[i])
+        self.__keep_solution(mixed_strategy_l, regret_vector_l)
+        return mixed_strategy_l, regret_vector_l
+
+    def __result(self, mixed_strategy_l, regret_vector_l, **kwargs):
+        """the `Result` of the given approximate NE, kwargs are passed on to it"""
+        # reset players with the equilibrium to calculate payoff on it
+        for i, player in enumerate(self.players):
+            player.init_mixed_strategies(mixed_strategy_l[i])
+        payoff_l = [
+            player.get_payoff(mixed_strategy)
+            for player, mixed_strategy in zip(self.players, mixed_strategy_l)
+        ]
+        return Result(mixed_strategy_l, payoff_l, regret_vector_l, **kwargs)
+
+    def solve_exact(self, method="auto", max_equilibria=None):
+        """
+        find the exact NEs of a two-person game, instead of approximating one.
+        method:
+            "support": support enumeration, all the NEs of a nondegenerate game
+            "lemke_howson": Lemke-Howson pivoting from every dropped label,
+                fast for big games but it may miss some NEs
+            "auto": support enumeration when the supports are no more than
+                `SUPPORT_ENUMERATION_MAX` pairs, or Lemke-Howson otherwise
+        max_equilibria: stop after finding so many NEs
+        return a `Result` of the first NE, with all the NEs found in `equilibria`
+        """
+        if self.players_num != 2:
+            raise UnsupportedError(
+                "exact solving is for two players, not %s players"
+                % self.players_num
+            )
+        if self.graphical:
+            raise UnsupportedError("exact solving is for the payoffs over all players")
+        self.__regularize_payoffs()
+        A = self.players[0].payoff_tensor
+        B = self.players[1].payoff_tensor
+        if method == "auto":
+            supports_num = math.comb(sum(A.shape), A.shape[0]) - 1
+            method = "support" if supports_num <= SUPPORT_ENUMERATION_MAX else "lemke_howson"
+        if method == "support":
+            equilibria = support_enumeration(A, B, max_equilibria)
+        elif method == "lemke_howson":
+            equilibria = []
+            for label in range(sum(A.shape)):
+                x, y = lemke_howson(A, B, label)
+                if not any(
+                    np.allclose(x, e[0], atol=1e-6) and np.allclose(y, e[1], atol=1e-6)
+                    for e in equilibria
+                ):
+                    equilibria.append([x, y])
+                if max_equilibria is not None and len(equilibria) >= max_equilibria:
+                    break
+        else:
+            raise ParameterError("unknown exact method %s" % method)
+        if not equilibria:
+            # support enumeration may miss all the NEs of a degenerate game
+            equilibria = [lemke_howson(A, B)]
+
+        self.reporter.header(
+            "Nash Equilibrium Exact Solution: %s equilibria" % len(equilibria)
+        )
+        result_l = []
+        for mixed_strategy_l in equilibria:
+            result = self.__result(
+                mixed_strategy_l,
+                self.compute_regret_vectors(mixed_strategy_l),
+                stop_reason="exact",
+            )
+            self.reporter.equilibrium(result)
+            result_l.append(result)
+        first = result_l[0]
+        for player, mixed_strategy in zip(self.players, first.equilibrium):
+            player.init_mixed_strategies(mixed_strategy)
+        return Result(
+            first.equilibrium,
+            first.payoffs,
+            first.deviations,
+            stop_reason="exact",
+            equilibria=result_l,
+        )
+
+    def run(
+        self,
+        iterations=10**4 * 6,
+        rate=10**-5,
+        engine="tensor",
+        order="gauss-seidel",
+        tol=None,
+        patience=None,
+        time_budget=None,
+        schedule="constant",
+        rate_decay=10**-4,
+        record="list",
+        record_every=1,
+        record_capacity=None,
+        trajectory_file=None,
+        solver="grm",
+        eliminate=False,
+        cache=None,
+        instrument=None,
+    ):
+        """run iterations
+        for two-person games, solver="exact" finds the exact NEs instead, see `solve_exact`
+        engine: how the vertex payoffs are evaluated
+            "tensor": contract the payoff tensor with the others' mixed strategies (fast)
+            "vertex": build the joint distribution on every vertex (the reference)
+            "joint": all players in one pass sharing partial products (fastest)
+        order: how players are updated within an iteration
+            "gauss-seidel": one after another, each seeing the earlier updates
+            "jacobi": simultaneously, all on the strategies of the previous iteration
+        `iterations` is the most to run, see `iterate` for stopping early
+        on tol, patience and time_budget, for the step size schedules,
+        for the recording policies of the paths drawn by `plot_2` and `plot_3`,
+        for streaming the trajectory into files, for the solvers other than GRM,
+        and for eliminating strictly dominated strategies before iterating
+        cache: an `EquilibriumCache` to look the approximate NE up in, and to store it into,
+            unless the trajectory is streamed into files
+        instrument: an `Instrumentation` of the iterations, see `iterate`
+        return a `Result`
+        """
+        if order not in ("gauss-seidel", "jacobi"):
+            raise ParameterError("unknown update order %s" % order)
+        if solver == "exact":
+            return self.solve_exact()
+
+        # show initial strategy
+        self.reporter.initial_strategies([p.mixed_strategy for p in self.players])
+
+        self.iterations = iterations
+        self.reporter.header(
+            "Nash Equilibrium Approximation: %s iterations" % self.iterations
+        )
+
+        self.__regularize_payoffs()
+
+        hit = None
+        if cache is not None and trajectory_file is None:
+            key = cache.key(
+                self,
+                {
+                    "run": "run",
+                    "dtype": self.dtype.str,
+                    "iterations": iterations,
+                    "rate": rate,
+                    "engine": engine,
+                    "order": order,
+                    "tol": tol,
+                    "patience": patience,
+                    "time_budget": time_budget,
+                    "schedule": schedule,
+                    "rate_decay": rate_decay,
+                    "solver": self.__solver_name(solver),
+                    "eliminate": eliminate,
+                },
+                [p.mixed_strategy for p in self.players],
+            )
+            hit = cache.get(key)
+        if hit is not None:
+            self.reporter.message("Found in cache")
+            mixed_strategy_l, regret_vector_l, meta = hit
+            self.stop_reason = meta["stop_reason"]
+            self.iterations_used = meta["iterations_used"]
+            if meta.get("surviving_strategies") is not None:
+                self.surviving_strategies = [
+                    np.asarray(a, dtype=int) for a in meta["surviving_strategies"]
+                ]
+            elif eliminate:
+                # an entry written without them
+                self.surviving_strategies = self.eliminate_dominated()
+            for player in self.players:
+                player.clear_collected_data(record, record_every, record_capacity)
+            self.__keep_solution(mixed_strategy_l, regret_vector_l)
+        else:
+            mixed_strategy_l, regret_vector_l = self.iterate(
+                iterations,
+                rate,
+                engine=engine,
+                order=order,
+                tol=tol,
+                patience=patience,
+                time_budget=time_budget,
+                schedule=schedule,
+                rate_decay=rate_decay,
+                record=record,
+                record_every=record_every,
+                record_capacity=record_capacity,
+                trajectory_file=trajectory_file,
+                solver=solver,
+                eliminate=eliminate,
+                instrument=instrument,
+            )
+            if cache is not None and trajectory_file is None:
+                cache.put(
+                    key,
+                    mixed_strategy_l,
+                    regret_vector_l,
+                    stop_reason=self.stop_reason,
+                    iterations_used=self.iterations_used,
+                    surviving_strategies=(
+                        [np.asarray(a).tolist() for a in self.surviving_strategies]
+                        if eliminate
+                        else None
+                    ),
+                )
+        surviving_l = None
+        if eliminate:
+            surviving_l = self.surviving_strategies
+        if eliminate and hit is None:
+            self.reporter.eliminated(
+                surviving_l, [p.pure_strategies_num for p in self.players]
+            )
 
         # output the results
-        temp_l = []
-        for i, (mixed_strategy, regret_vector) in enumerate(
-            zip(mixed_strategy_l, regret_vector_l)
+        result = self.__result(
+            mixed_strategy_l,
+            regret_vector_l,
+            iterations_used=self.iterations_used,
+            stop_reason=self.stop_reason,
+            surviving_strategies=surviving_l,
+            cached=hit is not None,
+        )
+        self.reporter.equilibrium(result)
+        self.reporter.stopped(result)
+        return result
+
+    def resolve(self, iterations=10**4 * 6, rate=10**-5, tol=None, **kwargs):
+        """
+        run again after a few payoff edits, e.g. by `player_assign_payoff`,
+        from where the last run stopped rather than from scratch:
+            the players start from the last approximate NE,
+            the payoffs stay regularized, and edits are put on the same scale,
+                so only a player whose edits go beyond [-1000, 1000] is regularized again,
+            the iterations stop once the overall regret sum is back to
+                that of the last approximate NE, or to `tol` if given,
+                rescaled for the players regularized again
+        kwargs are passed on to `iterate`, see `run`
+        return a `Result`
+        """
+        if self.last_equilibrium is None:
+            raise NotSolvedError("no approximate NE to resolve from, run first")
+        for player, mixed_strategy in zip(self.players, self.last_equilibrium):
+            player.init_mixed_strategies(mixed_strategy)
+
+        self.iterations = iterations
+        self.reporter.header(
+            "Nash Equilibrium Re-solving: %s iterations at most" % self.iterations
+        )
+        self.__regularize_payoffs()
+        if tol is None:
+            # the last regret sums on the scales the payoffs are regularized to now
+            tol = sum(
+                regret_sum * player.payoff_scale / scale
+                for regret_sum, scale, player in zip(
+                    self.last_regret_sums, self.last_payoff_scales, self.players
+                )
+            )
+        mixed_strategy_l, regret_vector_l = self.iterate(
+            iterations, rate, tol=tol, **kwargs
+        )
+        result = self.__result(
+            mixed_strategy_l,
+            regret_vector_l,
+            iterations_used=self.iterations_used,
+            stop_reason=self.stop_reason,
+        )
+        self.reporter.equilibrium(result)
+        self.reporter.stopped(result)
+        return result
+
+    def explore(
+        self,
+        starts=100,
+        workers=None,
+        seed=None,
+        iterations=10**4 * 6,
+        rate=10**-5,
+        engine="joint",
+        order="gauss-seidel",
+        tol=5 * 10**-2,
+        solver="grm",
+    ):
+        """
+        run `starts` random initial strategies in parallel on a pool of `workers` processes
+        (all the cores by default), and merge the approximate NEs into a catalogue.
+        start k is randomized with the k-th of the streams spawned from `seed`,
+        or from the game's seed if None (see `spawn`), so the exploring is reproducible
+        on every call, no matter how the starts are spread over the workers.
+        the regularized payoff vectors are put into shared memory once,
+        and every worker process attaches to them rather than getting its own copy.
+        two approximates are the same NE if no player's mixed strategies differ
+        more than `tol` on any pure strategy.
+        return the catalogue: a list of dicts with keys
+            "equilibrium": mixed strategies of all players,
+            "deviation": regret vectors of all players,
+            "hits": how many starts converged to it
+        sorted by hits
+        """
+        self.__regularize_payoffs()
+        if seed is None:
+            streams = self.spawn(starts)
+        else:
+            streams = _spawn_seed_sequences(_make_seed_sequence(seed), starts)
+        sizes = [p.payoff_vector.size for p in self.players]
+        shm = shared_memory.SharedMemory(
+            create=True, size=sum(sizes) * self.dtype.itemsize
+        )
+        try:
+            shared = np.ndarray(sum(sizes), dtype=self.dtype, buffer=shm.buf)
+            shared[:] = np.concatenate([p.payoff_vector for p in self.players])
+            self.reporter.header(
+                "Nash Equilibrium Exploration: %s starts, %s iterations"
+                % (starts, iterations)
+            )
+            pures_num_l = [p.pure_strategies_num for p in self.players]
+            neighbourhoods = [
+                None if p.neighbours is None else [j + 1 for j in p.neighbours]
+                for p in self.players
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_explore_worker_init,
+                initargs=(
+                    shm.name,
+                    self.dtype.str,
+                    pures_num_l,
+                    neighbourhoods,
+                    sizes,
+                    iterations,
+                    rate,
+                    engine,
+                    order,
+                    solver,
+                ),
+            ) as executor:
+                chunksize = max(1, starts // ((workers or os.cpu_count() or 1) * 4))
+                results = executor.map(
+                    _explore_worker_run,
+                    streams,
+                    chunksize=chunksize,
+                )
+                catalogue = []
+                for mixed_strategy_l, regret_vector_l in results:
+                    self.__catalogue_merge(
+                        catalogue, mixed_strategy_l, regret_vector_l, tol
+                    )
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+        catalogue.sort(key=lambda ne: -ne["hits"])
+        self.reporter.catalogue(catalogue)
+        return catalogue
+
+    def __catalogue_merge(self, catalogue, mixed_strategy_l, regret_vector_l, tol):
+        """count an approximate NE into the catalogue, keeping the least deviated one"""
+        regret_sum = np.sum([r.sum() for r in regret_vector_l])
+        for ne in catalogue:
+            distance = max(
+                np.abs(a - b).max() for a, b in zip(ne["equilibrium"], mixed_strategy_l)
+            )
+            if distance <= tol:
+                ne["hits"] += 1
+                if regret_sum < np.sum([r.sum() for r in ne["deviation"]]):
+                    ne["equilibrium"] = mixed_strategy_l
+                    ne["deviation"] = regret_vector_l
+                return
+        catalogue.append(
+            {"equilibrium": mixed_strategy_l, "deviation": regret_vector_l, "hits": 1}
+        )
+
+
+class SymmetricGame(object):
+    """
+    a symmetric game: all players use the same pure strategies,
+    and a player's payoff depends only on its own pure strategy
+    and how many of the other players use each pure strategy, not on who they are.
+    the payoffs are stored once as a table of shape (g, profiles),
+    where a profile is the counts of the other n-1 players on the g pure strategies,
+    and there are C(n+g-2, g-1) profiles instead of g^n combinations per player.
+    the symmetric NE, where all players use the same mixed strategy,
+    is approximated with one representative player.
+    dtype, reporter, seed: see `Game`
+    """
+
+    def __init__(
+        self,
+        players_num,
+        pure_strategies_num,
+        dtype=np.float64,
+        reporter="console",
+        seed=None,
+    ):
+        players_num = int(players_num)
+        pure_strategies_num = int(pure_strategies_num)
+        if players_num < 2 or pure_strategies_num < 2:
+            raise GameError(
+                "%s players with %s strategies, no game"
+                % (players_num, pure_strategies_num)
+            )
+        self.players_num = players_num
+        self.pure_strategies_num = pure_strategies_num
+        # the profiles of the others' counts on pure strategies, as a (profiles, g) array,
+        # enumerated by stars and bars: the g-1 bars among the n-1 others and the bars,
+        # in the reverse order so that the counts on the first strategies go first
+        others_num = players_num - 1
+        bars = np.fromiter(
+            itertools.chain.from_iterable(
+                itertools.combinations(
+                    range(others_num + pure_strategies_num - 1), pure_strategies_num - 1
+                )
+            ),
+            dtype=np.int64,
+        ).reshape(-1, pure_strategies_num - 1)[::-1]
+        bars = np.hstack(
+            [
+                np.full((len(bars), 1), -1),
+                bars,
+                np.full((len(bars), 1), others_num + pure_strategies_num - 1),
+            ]
+        )
+        self.profiles = np.diff(bars, axis=1) - 1
+        self.profiles_num = len(self.profiles)
+        # how many combinations of the others fall on every profile, the multinomial
+        # coefficients in log space, which overflow neither int64 nor float64
+        log_factorials = np.concatenate(
+            [[0.0], np.cumsum(np.log(np.arange(1, others_num + 1)))]
+        )
+        self.profile_log_multiplicity = (
+            log_factorials[others_num] - log_factorials[self.profiles].sum(axis=1)
+        )
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ParameterError("payoffs cannot be stored as %s" % self.dtype)
+        self.reporter = _make_reporter(reporter)
+        self.rng = np.random.default_rng(_make_seed_sequence(seed))
+        # payoff_table is kept as payoff_scale * (original payoffs) + payoff_offset
+        self.payoff_table = None
+        self.payoff_scale = 1.0
+        self.payoff_offset = 0.0
+        self.mixed_strategy = None
+
+    @property
+    def payoff_table_orig(self):
+        """the original payoffs, recovered from the regularized ones as a new array"""
+        if self.payoff_table is None:
+            return None
+        return (self.payoff_table - self.payoff_offset) / self.payoff_scale
+
+    def __set_payoff_table(self, payoff_table):
+        self.payoff_table = payoff_table
+        self.payoff_scale = 1.0
+        self.payoff_offset = 0.0
+
+    def assign_random_payoff(self, po_min=-1000, po_max=1000):
+        self.__set_payoff_table(
+            self.rng.integers(
+                po_min, po_max, (self.pure_strategies_num, self.profiles_num)
+            ).astype(self.dtype)
+        )
+        self.reporter.message("Payoff functions were randomized")
+
+    def profile_rank(self, counts):
+        """
+        the index of the others' `counts` on the pure strategies in `profiles`,
+        or None if they are not a profile
+        """
+        counts = [int(c) for c in counts]
+        if (
+            len(counts) != self.pure_strategies_num
+            or min(counts) < 0
+            or sum(counts) != self.players_num - 1
         ):
-            temp_l.append(regret_vector.sum())
-            print(
-                "Player %s:" % (i + 1),
-                "Nash Eq.",
-                mixed_strategy.round(4).tolist(),
-                "Payoff",
-                round(self.players[i].get_payoff(mixed_strategy), 4),
-                "Deviation",
-                regret_vector.round(4).tolist(),
+            return None
+        # the profiles before are those with more on the first strategy that differs
+        k = 0
+        rest = self.players_num - 1
+        for i, c in enumerate(counts[:-1]):
+            parts = self.pure_strategies_num - 1 - i
+            if rest > c:
+                k += math.comb(rest - c - 1 + parts, parts)
+            rest -= c
+        return k
+
+    def assign_payoff(self, pure_strategy, counts, payoff):
+        """
+        the payoff of a player using `pure_strategy` (starting from 1),
+        when the others' counts on the pure strategies are `counts`, e.g. (3, 0, 16)
+        """
+        if self.payoff_table is None:
+            self.__set_payoff_table(
+                np.zeros((self.pure_strategies_num, self.profiles_num), dtype=self.dtype)
             )
-        regret_sum_a = np.array(temp_l).round(4)
-        print(
-            "Deviation Sum:",
-            *regret_sum_a,
-            "Overall: %s" % np.round(regret_sum_a.sum(), 4)
+        k = self.profile_rank(counts)
+        if k is None or not 1 <= pure_strategy <= self.pure_strategies_num:
+            raise GameError("strategy %s on counts %s is wrong" % (pure_strategy, counts))
+        self.payoff_table[pure_strategy - 1, k] = (
+            self.payoff_scale * payoff + self.payoff_offset
+        )
+
+    def set_payoff_table(self, payoff_table):
+        """the whole (g, profiles) payoff table, profiles in the order of `profiles`"""
+        payoff_table = np.array(payoff_table, dtype=self.dtype)
+        if payoff_table.shape != (self.pure_strategies_num, self.profiles_num):
+            raise GameError(
+                "payoff table of shape %s, not %s"
+                % (payoff_table.shape, (self.pure_strategies_num, self.profiles_num))
+            )
+        self.__set_payoff_table(payoff_table)
+
+    def init_mixed_strategy(self, init_strategy=None):
+        if init_strategy is None:
+            str_ = self.rng.integers(1, 100, self.pure_strategies_num)
+            self.mixed_strategy = str_ / str_.sum()
+            self.reporter.message("Initial strategy was randomized")
+        else:
+            if len(init_strategy) != self.pure_strategies_num:
+                raise StrategyError(
+                    "%s pures initialized to %s"
+                    % (self.pure_strategies_num, init_strategy)
+                )
+            self.mixed_strategy = np.array(init_strategy).astype(np.float64)
+            self.reporter.message("Initial strategy was customized")
+
+    def compute_vertex_payoffs(self, mixed_strategy, payoff_table):
+        """
+        the payoff of every pure strategy when all the others use `mixed_strategy`:
+        the profiles are multinomially distributed over the others' counts
+        time complexity: about g * profiles multiplications
+        """
+        positive = mixed_strategy > 0
+        log_prob = self.profile_log_multiplicity + self.profiles.dot(
+            np.log(np.where(positive, mixed_strategy, 1.0))
+        )
+        if not positive.all():
+            log_prob[self.profiles[:, ~positive].any(axis=1)] = -np.inf
+        profile_prob = np.exp(log_prob)
+        return payoff_table.dot(profile_prob.astype(payoff_table.dtype, copy=False))
+
+    def run(self, iterations=10**4 * 6, rate=10**-5, tol=None, solver="grm"):
+        """
+        run iterations on the representative player, see `Game.iterate`
+        return a `Result` with the symmetric NE as the one mixed strategy of all players
+        """
+        self.reporter.header(
+            "Symmetric Nash Equilibrium Approximation: %s iterations" % iterations
+        )
+        # regularize the payoff to [-1000, 1000] in place for accuracy, as `Game.run` does
+        a, b = _regularize(self.payoff_table)
+        self.payoff_scale = a * self.payoff_scale
+        self.payoff_offset = a * self.payoff_offset + b
+
+        self.solver = make_solver(solver)
+        self.solver.reset(1)
+        x = self.mixed_strategy
+        regret_sum_old = 10**10  # super big number to start with
+        stop_reason = "iterations"
+        iterations_used = iterations
+        for t in range(iterations):
+            v = self.compute_vertex_payoffs(x, self.payoff_table)
+            regret_vector = np.maximum(v - x.dot(v), 0)
+            if regret_vector.sum() < regret_sum_old:
+                mixed_strategy, regret_vector_best = x, regret_vector
+                regret_sum_old = regret_vector.sum()
+            if tol is not None and regret_sum_old <= tol:
+                stop_reason = "tol"
+                iterations_used = t + 1
+                break
+            x = self.solver.step(0, x, v, regret_vector, rate)
+        if self.solver.averaging:
+            x = self.solver.average(0)
+            v = self.compute_vertex_payoffs(x, self.payoff_table)
+            regret_vector = np.maximum(v - x.dot(v), 0)
+            if regret_vector.sum() < regret_sum_old:
+                mixed_strategy, regret_vector_best = x, regret_vector
+        self.mixed_strategy = mixed_strategy
+
+        payoff = mixed_strategy.dot(
+            self.compute_vertex_payoffs(mixed_strategy, self.payoff_table)
+        )
+        payoff = float((payoff - self.payoff_offset) / self.payoff_scale)
+        result = Result(
+            [mixed_strategy],
+            [payoff],
+            [regret_vector_best],
+            iterations_used=iterations_used,
+            stop_reason=stop_reason,
         )
+        self.reporter.symmetric_equilibrium(self.players_num, result)
+        return result
+
+
+# the game of an `explore` worker process, attached to the shared payoff vectors
+_explore_state = {}
+
+
+def _explore_worker_init(
+    shm_name,
+    dtype,
+    pures_num_l,
+    neighbourhoods,
+    sizes,
+    iterations,
+    rate,
+    engine,
+    order,
+    solver,
+):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    game = Game(dtype, reporter=None)
+    for pures_num in pures_num_l:
+        game.player_join(Player(pures_num))
+    shared = np.ndarray(sum(sizes), dtype=dtype, buffer=shm.buf)
+    game.player_attach_payoff_vectors(
+        np.split(shared, np.cumsum(sizes)[:-1]), neighbourhoods
+    )
+    _explore_state.update(
+        shm=shm,
+        game=game,
+        iterations=iterations,
+        rate=rate,
+        engine=engine,
+        order=order,
+        solver=solver,
+    )
+
+
+def _explore_worker_run(stream):
+    game = _explore_state["game"]
+    rng = np.random.default_rng(stream)
+    for player in game.players:
+        player.init_mixed_strategies(rng=rng)
+    return game.iterate(
+        _explore_state["iterations"],
+        _explore_state["rate"],
+        _explore_state["engine"],
+        _explore_state["order"],
+        record="off",
+        solver=_explore_state["solver"],
+    )
+
+
+# the file extensions of `Game.load_payoffs`
+PAYOFF_FILE_EXTENSIONS = (".npy", ".npz", ".csv", ".nfg")
+
+
+def _cli_game_paths(paths, manifests):
+    """
+    the game files of the command line: files as they are, the payoff files in directories,
+    and the files listed in manifests, one per line relative to the manifest,
+    with blank lines and lines starting with # skipped
+    """
+    game_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            game_paths.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if os.path.splitext(name)[1].lower() in PAYOFF_FILE_EXTENSIONS
+            )
+        else:
+            game_paths.append(path)
+    for manifest in manifests:
+        with open(manifest) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    game_paths.append(
+                        os.path.join(os.path.dirname(manifest), line)
+                    )
+    return game_paths
+
+
+def _cli_solve(path, options):
+    """solve a game file as the command line options tell, in a JSON-ready dict"""
+    time_start = time.perf_counter()
+    record = {"game": path, "seed": options["seed"]}
+    try:
+        game = Game(options["dtype"], reporter=None, seed=options["seed"])
+        game.load_payoffs(path, mmap=options["mmap"])
+        record["strategies"] = [p.pure_strategies_num for p in game.players]
+        game.player_init_mixed_strategies()
+        if options["solver"] == "exact":
+            result = game.solve_exact()
+            record.update(result.as_dict())
+            record["epsilon"] = game.verify(result).epsilon
+            for ne, d in zip(result.equilibria, record["equilibria"]):
+                d["epsilon"] = game.verify(ne).epsilon
+        elif options["starts"] > 1:
+            mixed_strategy_l, regret_vector_l = game.run_batch(
+                starts=options["starts"],
+                iterations=options["iterations"],
+                rate=options["rate"],
+                solver=options["solver"],
+            )
+            # the best of the starts
+            best = int(np.argmin(sum(r.sum(axis=1) for r in regret_vector_l)))
+            equilibrium = [x[best] for x in mixed_strategy_l]
+            for player, mixed_strategy in zip(game.players, equilibrium):
+                player.init_mixed_strategies(mixed_strategy)
+            result = Result(
+                equilibrium,
+                [p.get_payoff(x) for p, x in zip(game.players, equilibrium)],
+                [r[best] for r in regret_vector_l],
+                iterations_used=options["iterations"],
+                stop_reason="iterations",
+            )
+            record.update(result.as_dict())
+            record["epsilon"] = game.verify(result).epsilon
+        else:
+            result = game.run(
+                iterations=options["iterations"],
+                rate=options["rate"],
+                engine=options["engine"],
+                tol=options["tol"],
+                record="off",
+                solver=options["solver"],
+                eliminate=options["eliminate"],
+            )
+            record.update(result.as_dict())
+            record["epsilon"] = game.verify(result).epsilon
+    except Exception as e:
+        # one game going wrong is written down, and does not stop the others
+        record["error"] = "%s: %s" % (type(e).__name__, e)
+    record["seconds"] = time.perf_counter() - time_start
+    return record
+
+
+def _cli_write(records, out):
+    """write the records as JSON lines as they come, return how many failed"""
+    failed = 0
+    for record in records:
+        failed += "error" in record
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+    return failed
+
+
+def main(argv=None):
+    """
+    solve game files from the command line, and write one JSON line per game
+        python -m grm games/ --manifest sweep.txt --starts 100 --workers 8 -o results.jsonl
+    return 1 if any game failed, otherwise 0
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m grm", description="approximate the NEs of games in files"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="game files (%s), or directories of them" % ", ".join(PAYOFF_FILE_EXTENSIONS),
+    )
+    parser.add_argument(
+        "--manifest",
+        action="append",
+        default=[],
+        help="a file listing game files, one per line",
+    )
+    parser.add_argument("--iterations", type=int, default=10**4 * 6)
+    parser.add_argument("--rate", type=float, default=10**-5)
+    parser.add_argument(
+        "--starts",
+        type=int,
+        default=1,
+        help="initial strategies per game run at once, the best of which is written",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="of every game, so that any game solves the same on its own",
+    )
+    parser.add_argument(
+        "--solver",
+        default="grm",
+        choices=sorted(SOLVERS) + ["exact"],
+        help='"exact" for all the exact NEs of two-person games',
+    )
+    parser.add_argument(
+        "--engine", choices=("tensor", "joint", "vertex"), help="tensor by default"
+    )
+    parser.add_argument("--tol", type=float, help="stop once the regret sum is below")
+    parser.add_argument(
+        "--eliminate",
+        action="store_true",
+        help="eliminate strictly dominated strategies first",
+    )
+    parser.add_argument(
+        "--dtype", default="float64", choices=("float64", "float32"), help="payoffs"
+    )
+    parser.add_argument(
+        "--no-mmap",
+        dest="mmap",
+        action="store_false",
+        help="read .npy files into memory rather than mapping them",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="processes to solve games in, all CPUs by default"
+    )
+    parser.add_argument("-o", "--output", help="JSON lines file, stdout by default")
+    args = parser.parse_args(argv)
+
+    # run_batch and solve_exact take none of the options of run
+    for option, value in (
+        ("--engine", args.engine),
+        ("--tol", args.tol),
+        ("--eliminate", args.eliminate or None),
+    ):
+        if value is not None and args.starts > 1:
+            parser.error("%s does not apply to --starts > 1" % option)
+        if value is not None and args.solver == "exact":
+            parser.error("%s does not apply to --solver exact" % option)
+    if args.starts > 1 and args.solver == "exact":
+        parser.error("--starts does not apply to --solver exact")
+    game_paths = _cli_game_paths(args.paths, args.manifest)
+    if not game_paths:
+        parser.error("no game files")
+    options = {
+        "iterations": args.iterations,
+        "rate": args.rate,
+        "starts": args.starts,
+        "seed": args.seed,
+        "solver": args.solver,
+        "engine": args.engine or "tensor",
+        "tol": args.tol,
+        "eliminate": args.eliminate,
+        "dtype": args.dtype,
+        "mmap": args.mmap,
+    }
+
+    out = sys.stdout if args.output is None else open(args.output, "w")
+    try:
+        if args.workers == 1:
+            failed = _cli_write(
+                (_cli_solve(path, options) for path in game_paths), out
+            )
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                futures = [
+                    executor.submit(_cli_solve, path, options) for path in game_paths
+                ]
+                try:
+                    # written as they are done, not in the order of the games
+                    failed = _cli_write(
+                        (future.result() for future in as_completed(futures)), out
+                    )
+                except BaseException:
+                    # no waiting for the games not started yet
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    pass
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+import grm
+
+
+def test_lemke_howson_degenerate():
+    # 0/1 payoffs are degenerate, and cycled without lexicographic pivoting
+    rng = np.random.default_rng(19)
+    A = rng.integers(0, 2, (8, 8)).astype(np.float64)
+    B = rng.integers(0, 2, (8, 8)).astype(np.float64)
+    for label in range(16):
+        x, y = grm.lemke_howson(A, B, label, max_pivots=10**4)
+        assert np.isclose(x.sum(), 1) and np.isclose(y.sum(), 1)
+        assert A.dot(y).max() <= x.dot(A).dot(y) + 1e-9
+        assert x.dot(B).max() <= x.dot(B).dot(y) + 1e-9
+
+
+def test_solve_exact_without_initial_strategies():
+    game = grm.Game(reporter=None)
+    for _ in range(2):
+        game.player_join(grm.Player(2))
+    game.set_payoffs({"11": (1, -1), "12": (-1, 1), "21": (-1, 1), "22": (1, -1)})
+    result = game.solve_exact()
+    assert len(result.equilibria) == 1
+    x, y = result.equilibrium
+    assert np.allclose(x, [0.5, 0.5]) and np.allclose(y, [0.5, 0.5])
+
+
+def test_eliminated_trajectory_file(tmp_path):
+    # the third strategy of both players is strictly dominated
+    game = grm.Game(reporter=None, seed=0)
+    for _ in range(2):
+        game.player_join(grm.Player(3))
+    game.set_payoff_tensor(1, [[3, 0, 5], [1, 2, 6], [0, -1, -2]])
+    game.set_payoff_tensor(2, [[2, 1, -5], [0, 3, -4], [1, 0, -6]])
+    game.player_init_mixed_strategies()
+    game.run(iterations=50, eliminate=True, trajectory_file=str(tmp_path))
+    trajectory = grm.Trajectory(str(tmp_path))
+    assert [path.shape for path in trajectory.paths] == [(50, 3), (50, 3)]
+    assert np.allclose(trajectory.paths[0].sum(axis=1), 1)
+    assert (trajectory.paths[0][:, 2] == 0).all()
+
+
+def test_cache_corrupted_entry_and_surviving_strategies(tmp_path):
+    cache = grm.EquilibriumCache(str(tmp_path))
+
+    def solve():
+        game = grm.Game(reporter=None, seed=0)
+        for _ in range(2):
+            game.player_join(grm.Player(3))
+        game.set_payoff_tensor(1, [[3, 0, 5], [1, 2, 6], [0, -1, -2]])
+        game.set_payoff_tensor(2, [[2, 1, -5], [0, 3, -4], [1, 0, -6]])
+        game.player_init_mixed_strategies()
+        return game.run(iterations=50, eliminate=True, cache=cache)
+
+    first = solve()
+    assert not first.cached
+    (entry,) = tmp_path.glob("*.npz")
+    entry.write_bytes(entry.read_bytes()[:40])
+    # a truncated entry is a miss and is replaced
+    assert not solve().cached
+    hit = solve()
+    assert hit.cached
+    assert [list(a) for a in hit.surviving_strategies] == [
+        list(a) for a in first.surviving_strategies
+    ]
+
+
+def test_run_batch_same_starts_on_every_call():
+    game = grm.Game(reporter=None, seed=7)
+    for _ in range(2):
+        game.player_join(grm.Player(3))
+    game.player_assign_random_payoff()
+    first = game.run_batch(iterations=20, starts=4)
+    second = game.run_batch(iterations=20, starts=4)
+    for x, y in zip(first[0], second[0]):
+        assert np.array_equal(x, y)
+
+
+def test_symmetric_profile_probabilities_many_players():
+    # the multinomial coefficients of 29 others overflow int64
+    game = grm.SymmetricGame(30, 3, reporter=None)
+    x = np.array([0.2, 0.3, 0.5])
+    ones = np.ones((1, game.profiles_num))
+    assert np.isclose(game.compute_vertex_payoffs(x, ones)[0], 1)
+    assert np.isclose(np.exp(game.profile_log_multiplicity).sum(), 3**29)
+    assert game.profile_rank(game.profiles[234]) == 234
+
+
+def test_downsample_cycling_path():
+    # the Shapley game cycles around its NE, turning at every step
+    game = grm.Game(reporter=None, seed=1)
+    for _ in range(2):
+        game.player_join(grm.Player(3))
+    game.set_payoff_tensor(1, [[0, 0, 1], [1, 0, 0], [0, 1, 0]])
+    game.set_payoff_tensor(2, [[0, 1, 0], [0, 0, 1], [1, 0, 0]])
+    game.player_init_mixed_strategies()
+    game.run(iterations=2 * 10**4, rate=10**-4)
+    path = game.players[0].recorder.path
+    points = np.stack(
+        [path.dot([0, np.sqrt(2) / 2, np.sqrt(2)]), path.dot([0, np.sqrt(6) / 2, 0])],
+        axis=1,
+    )
+    keep = grm.downsample_path(points, 10**-3)
+    assert len(keep) < len(points) / 2
+    # every point dropped is within the tolerance of the segment drawn over it
+    for a, b in zip(keep[:-1], keep[1:]):
+        chord = points[b] - points[a]
+        inner = points[a + 1 : b] - points[a]
+        w = np.clip(inner.dot(chord) / max(chord.dot(chord), 1e-300), 0, 1)
+        assert (np.hypot(*(inner - w[:, None] * chord).T) <= 10**-3).all()
+
+
+def test_load_csv_shape(tmp_path):
+    # a 2x3 game with a combination left out
+    rows = "1,1,3,1\n1,2,0,2\n1,3,4,4\n2,1,5,0\n2,2,1,1\n"
+    path = tmp_path / "game.csv"
+    path.write_text("strategy_1,strategy_2,payoff_1,payoff_2\n" + rows)
+    game = grm.Game(reporter=None)
+    with pytest.raises(grm.GameError):
+        game.load_payoffs(str(path))
+    path.write_text("strategy_1:2,strategy_2:3,payoff_1,payoff_2\n" + rows)
+    game = grm.Game(reporter=None)
+    game.load_payoffs(str(path))
+    assert game.product_space_shape == (2, 3)
+    # the header written states the numbers of pure strategies
+    saved = tmp_path / "saved.csv"
+    game.save_payoffs(str(saved))
+    loaded = grm.Game(reporter=None)
+    loaded.load_payoffs(str(saved))
+    assert loaded.product_space_shape == (2, 3)
+    assert np.array_equal(
+        loaded.players[0].payoff_vector_orig, game.players[0].payoff_vector_orig
+    )